@@ -24,6 +24,8 @@ from typing import Type
 from urllib.parse import ParseResult
 from urllib.parse import urlparse
 
+from urllib3.util.retry import Retry
+
 import paasta_tools.paastaapi.apis as paastaapis
 from paasta_tools import paastaapi
 from paasta_tools.secret_tools import get_secret_provider
@@ -33,6 +35,21 @@ from paasta_tools.utils import SystemPaastaConfig
 
 log = logging.getLogger(__name__)
 
+# Enough pooled keep-alive connections for every concurrent request a CLI
+# fan-out makes to one API host, so none of them pays a fresh TCP/TLS setup.
+API_CONNECTION_POOL_MAXSIZE = 200
+# Retry brief API hiccups (e.g. a restarting paasta-api behind the LB) once
+# or twice before surfacing them; the last response is still returned as-is.
+# Only reads are retried: a 502 can come back after the API already acted on
+# a write (e.g. pausing the autoscaler), and replaying that is not safe.
+API_RETRIES = Retry(
+    total=2,
+    backoff_factor=0.1,
+    status_forcelist=[502, 503, 504],
+    method_whitelist=frozenset({"GET"}),
+    raise_on_status=False,
+)
+
 
 def get_paasta_ssl_opts(
     cluster: str, system_paasta_config: SystemPaastaConfig
@@ -81,6 +98,8 @@ def get_paasta_oapi_client_by_url(
     config.cert_file = cert_file
     config.key_file = key_file
     config.ssl_ca_cert = ssl_ca_cert
+    config.connection_pool_maxsize = API_CONNECTION_POOL_MAXSIZE
+    config.retries = API_RETRIES
 
     client = paastaapi.ApiClient(configuration=config)
     return PaastaOApiClient(
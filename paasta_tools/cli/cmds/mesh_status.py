@@ -96,7 +96,7 @@ def paasta_mesh_status_on_api_endpoint(
         )
     except Exception as e:
         output = [PaastaColors.red(f"Exception when talking to the API:")]
-        output.extend(str(e).split("\n"))
+        output.extend(str(e).splitlines())
         return 1, output
 
     output = []
@@ -119,13 +119,13 @@ def paasta_mesh_status_on_api_endpoint(
 
 
 def paasta_mesh_status(args) -> int:
-    system_paasta_config = load_system_paasta_config()
-
     # validate args, funcs have their own error output
     service = figure_out_service_name(args, args.soa_dir)
     if verify_instances(args.instance, service, [args.cluster]):
         return 1
 
+    system_paasta_config = load_system_paasta_config()
+
     return_code, mesh_output = paasta_mesh_status_on_api_endpoint(
         cluster=args.cluster,
         service=service,
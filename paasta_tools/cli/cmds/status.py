@@ -12,10 +12,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import concurrent.futures
 import difflib
+import os
 import shutil
 import sys
+import threading
 from collections import Counter
 from collections import defaultdict
 from datetime import datetime
@@ -23,6 +26,7 @@ from datetime import timedelta
 from enum import Enum
 from itertools import groupby
 from typing import Any
+from typing import Awaitable
 from typing import Callable
 from typing import Collection
 from typing import DefaultDict
@@ -30,11 +34,13 @@ from typing import Dict
 from typing import Iterable
 from typing import List
 from typing import Mapping
+from typing import Optional
 from typing import Sequence
 from typing import Tuple
 from typing import Type
 from typing import Union
 
+import a_sync
 import humanize
 from mypy_extensions import Arg
 from service_configuration_lib import read_deploy
@@ -42,6 +48,7 @@ from service_configuration_lib import read_deploy
 from paasta_tools import kubernetes_tools
 from paasta_tools.adhoc_tools import AdhocJobConfig
 from paasta_tools.api.client import get_paasta_oapi_client
+from paasta_tools.api.client import PaastaOApiClient
 from paasta_tools.cassandracluster_tools import CassandraClusterDeploymentConfig
 from paasta_tools.cli.utils import figure_out_service_name
 from paasta_tools.cli.utils import get_instance_configs_for_service
@@ -90,6 +97,11 @@ ALLOWED_INSTANCE_CONFIG: Sequence[Type[InstanceConfig]] = [
     TronActionConfig,
 ]
 
+# Instance status lookups are I/O bound API calls, so many can be in flight at once
+DEFAULT_STATUS_CONCURRENCY = 200
+
+OApiClientGetter = Callable[[str, SystemPaastaConfig], Optional[PaastaOApiClient]]
+
 InstanceStatusWriter = Callable[
     [
         Arg(str, "cluster"),
@@ -243,9 +255,11 @@ def paasta_status_on_api_endpoint(
     system_paasta_config: SystemPaastaConfig,
     verbose: int,
     new: bool = False,
+    client: Optional[PaastaOApiClient] = None,
 ) -> int:
     output.append("    instance: %s" % PaastaColors.cyan(instance))
-    client = get_paasta_oapi_client(cluster, system_paasta_config)
+    if client is None:
+        client = get_paasta_oapi_client(cluster, system_paasta_config)
     if not client:
         print("Cannot get a paasta-api client")
         exit(1)
@@ -1659,7 +1673,72 @@ def print_kafka_status(
     return 0
 
 
-def report_status_for_cluster(
+def memoized_oapi_client_getter() -> OApiClientGetter:
+    """Returns a thread-safe stand-in for get_paasta_oapi_client which only
+    builds one client per cluster, however many workers ask for it."""
+    clients: Dict[str, Optional[PaastaOApiClient]] = {}
+    locks: Dict[str, threading.Lock] = {}
+
+    def get_client(
+        cluster: str, system_paasta_config: SystemPaastaConfig
+    ) -> Optional[PaastaOApiClient]:
+        with locks.setdefault(cluster, threading.Lock()):
+            if cluster not in clients:
+                clients[cluster] = get_paasta_oapi_client(cluster, system_paasta_config)
+            return clients[cluster]
+
+    return get_client
+
+
+async def gather_instance_statuses_from_api(
+    cluster: str,
+    service: str,
+    instances: Sequence[str],
+    system_paasta_config: SystemPaastaConfig,
+    verbose: int,
+    new: bool,
+    get_client: Optional[OApiClientGetter] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> List[Tuple[int, List[str]]]:
+    """Queries the API for every instance concurrently, so that a service
+    with many instances takes about as long as its slowest instance rather
+    than the sum of all of them.
+
+    Each call runs on ``executor``, which callers share across every report
+    so there is a single bound on how many API calls are in flight. The
+    cluster's client is fetched from ``get_client`` on that executor too, so
+    building it doesn't hold up reports for other clusters.
+
+    :returns: a list of (return_code, output) tuples, in the same order as ``instances``
+    """
+    if get_client is None:
+        get_client = memoized_oapi_client_getter()
+
+    def status_for_instance(instance: str) -> Tuple[int, List[str]]:
+        client = get_client(cluster, system_paasta_config)
+        instance_output: List[str] = []
+        return_code = paasta_status_on_api_endpoint(
+            cluster=cluster,
+            service=service,
+            instance=instance,
+            output=instance_output,
+            system_paasta_config=system_paasta_config,
+            verbose=verbose,
+            new=new,
+            client=client,
+        )
+        return return_code, instance_output
+
+    loop = asyncio.get_event_loop()
+    return await asyncio.gather(
+        *[
+            loop.run_in_executor(executor, status_for_instance, instance)
+            for instance in instances
+        ]
+    )
+
+
+async def report_status_for_cluster(
     service: str,
     cluster: str,
     deploy_pipeline: Sequence[str],
@@ -1668,6 +1747,8 @@ def report_status_for_cluster(
     system_paasta_config: SystemPaastaConfig,
     verbose: int = 0,
     new: bool = False,
+    get_client: Optional[OApiClientGetter] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
 ) -> Tuple[int, Sequence[str]]:
     """With a given service and cluster, prints the status of the instances
     in that cluster"""
@@ -1710,18 +1791,20 @@ def report_status_for_cluster(
             output.append("    Git sha:    None (not deployed yet)")
 
     return_code = 0
-    return_codes = [
-        paasta_status_on_api_endpoint(
-            cluster=cluster,
-            service=service,
-            instance=deployed_instance,
-            output=output,
-            system_paasta_config=system_paasta_config,
-            verbose=verbose,
-            new=new,
-        )
-        for deployed_instance in instances
-    ]
+    instance_statuses = await gather_instance_statuses_from_api(
+        cluster=cluster,
+        service=service,
+        instances=instances,
+        system_paasta_config=system_paasta_config,
+        verbose=verbose,
+        new=new,
+        get_client=get_client,
+        executor=executor,
+    )
+    return_codes = []
+    for instance_return_code, instance_output in instance_statuses:
+        return_codes.append(instance_return_code)
+        output.extend(instance_output)
     if any(return_codes):
         return_code = 1
 
@@ -1905,11 +1988,17 @@ def paasta_status(args) -> int:
     """Print the status of a Yelp service running on PaaSTA.
     :param args: argparse.Namespace obj created from sys.args by cli"""
     soa_dir = args.soa_dir
-    system_paasta_config = load_system_paasta_config()
 
     return_codes = [0]
     tasks = []
+    instance_count = 0
+    # Building a client can mean renewing certs, so only do it once per
+    # cluster, and from the API call pool rather than before the fan-out
+    get_client = memoized_oapi_client_getter()
     clusters_services_instances = apply_args_filters(args)
+    # Loaded once, after filtering, and handed to everything below; nothing
+    # downstream should need to call load_system_paasta_config() again.
+    system_paasta_config = load_system_paasta_config()
     for cluster, service_instances in clusters_services_instances.items():
         for service, instances in service_instances.items():
             all_flink = all(i == FlinkDeploymentConfig for i in instances.values())
@@ -1932,23 +2021,72 @@ def paasta_status(args) -> int:
                             system_paasta_config=system_paasta_config,
                             verbose=args.verbose,
                             new=args.new,
+                            get_client=get_client,
                         ),
                     )
                 )
+                instance_count += len(instances)
             else:
                 print(missing_deployments_message(service))
                 return_codes.append(1)
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-        tasks = [executor.submit(t[0], **t[1]) for t in tasks]  # type: ignore
-        for future in concurrent.futures.as_completed(tasks):  # type: ignore
-            return_code, output = future.result()
-            print("\n".join(output))
-            return_codes.append(return_code)
+    return_codes.extend(
+        a_sync.block(
+            print_cluster_statuses, tasks, get_status_concurrency(instance_count)
+        )
+    )
 
     return max(return_codes)
 
 
+def get_status_concurrency(call_count: int) -> int:
+    """Sizes the API call pool to the number of instances being queried, up to
+    a cap which can be overridden with PAASTA_STATUS_CONCURRENCY."""
+    cap = DEFAULT_STATUS_CONCURRENCY
+    configured_cap = os.environ.get("PAASTA_STATUS_CONCURRENCY")
+    if configured_cap is not None:
+        try:
+            cap = int(configured_cap)
+        except ValueError:
+            cap = 0
+        if cap <= 0:
+            print(
+                f"Warning: ignoring PAASTA_STATUS_CONCURRENCY={configured_cap!r}, "
+                f"it must be a positive integer. Using {DEFAULT_STATUS_CONCURRENCY}.",
+                file=sys.stderr,
+            )
+            cap = DEFAULT_STATUS_CONCURRENCY
+    return max(1, min(cap, call_count))
+
+
+async def print_cluster_statuses(
+    tasks: Sequence[
+        Tuple[Callable[..., Awaitable[Tuple[int, Sequence[str]]]], Dict[str, Any]]
+    ],
+    max_workers: int,
+) -> List[int]:
+    """Runs every (report coroutine function, kwargs) pair concurrently and
+    prints each report as soon as it is ready, so one slow cluster doesn't hold
+    up the rest. Each report is printed as one block, with its instances in
+    the order they were requested.
+
+    All reports share one executor of ``max_workers`` threads for their API
+    calls; the reports themselves only await on this event loop, so no worker
+    thread ever waits on another.
+
+    :returns: the return code of each report, in completion order
+    """
+    return_codes = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for next_report in asyncio.as_completed(
+            [func(executor=executor, **kwargs) for func, kwargs in tasks]
+        ):
+            return_code, output = await next_report
+            print("\n".join(output))
+            return_codes.append(return_code)
+    return return_codes
+
+
 def bouncing_status_human(app_count, bounce_method):
     if app_count == 0:
         return PaastaColors.red("Disabled")
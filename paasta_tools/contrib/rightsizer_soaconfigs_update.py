@@ -1,6 +1,5 @@
 import argparse
 import logging
-from collections import defaultdict
 
 from paasta_tools.config_utils import AutoConfigUpdater
 from paasta_tools.contrib.paasta_update_soa_memcpu import get_report_from_splunk
@@ -9,15 +8,6 @@ from paasta_tools.utils import format_git_url
 from paasta_tools.utils import load_system_paasta_config
 
 NULL = "null"
-SUPPORTED_CSV_KEYS = (
-    "cpus",
-    "mem",
-    "disk",
-    "hacheck_cpus",
-    "cpu_burst_add",
-    "min_instances",
-    "max_instances",
-)
 
 
 def parse_args():
@@ -114,46 +104,52 @@ def get_default_git_remote():
     return default_git_remote
 
 
+def get_hacheck_sidecar_recommendation(val):
+    hacheck_cpus_value = max(0.1, min(float(val), 1))
+    return {
+        "hacheck": {
+            "requests": {"cpu": hacheck_cpus_value,},
+            "limits": {"cpu": hacheck_cpus_value,},
+        },
+    }
+
+
+# csv key -> (config key, function turning the csv value into the config value)
+RECOMMENDATION_TRANSFORMS = {
+    "cpus": ("cpus", float),
+    "mem": ("mem", lambda val: max(128, round(float(val)))),
+    "disk": ("disk", lambda val: max(128, round(float(val)))),
+    "hacheck_cpus": (
+        "sidecar_resource_requirements",
+        get_hacheck_sidecar_recommendation,
+    ),
+    "cpu_burst_add": ("cpu_burst_add", lambda val: min(1, float(val))),
+    "min_instances": ("min_instances", int),
+    "max_instances": ("max_instances", int),
+}
+SUPPORTED_CSV_KEYS = tuple(RECOMMENDATION_TRANSFORMS)
+
+
 def get_recommendation_from_result(result, keys_to_apply):
     rec = {}
     for key in keys_to_apply:
         val = result.get(key)
-        if not val or val == NULL:
+        if not val or val == NULL or key not in RECOMMENDATION_TRANSFORMS:
             continue
-        if key == "cpus":
-            rec["cpus"] = float(val)
-        elif key == "cpu_burst_add":
-            rec["cpu_burst_add"] = min(1, float(val))
-        elif key == "mem":
-            rec["mem"] = max(128, round(float(val)))
-        elif key == "disk":
-            rec["disk"] = max(128, round(float(val)))
-        elif key == "min_instances":
-            rec["min_instances"] = int(val)
-        elif key == "max_instances":
-            rec["max_instances"] = int(val)
-        elif key == "hacheck_cpus":
-            hacheck_cpus_value = max(0.1, min(float(val), 1))
-            rec["sidecar_resource_requirements"] = {
-                "hacheck": {
-                    "requests": {"cpu": hacheck_cpus_value,},
-                    "limits": {"cpu": hacheck_cpus_value,},
-                },
-            }
+        config_key, transform = RECOMMENDATION_TRANSFORMS[key]
+        rec[config_key] = transform(val)
     return rec
 
 
 def get_recommendations_by_service_file(results, keys_to_apply):
-    results_by_service_file = defaultdict(dict)
+    results_by_service_file = {}
     for result in results.values():
-        key = (
-            result["service"],
-            result["cluster"],
-        )  # e.g. (foo, marathon-norcal-stagef)
         rec = get_recommendation_from_result(result, keys_to_apply)
         if not rec:
             continue
-        results_by_service_file[key][result["instance"]] = rec
+        # e.g. (foo, marathon-norcal-stagef)
+        key = (result["service"], result["cluster"])
+        results_by_service_file.setdefault(key, {})[result["instance"]] = rec
     return results_by_service_file
 
 
@@ -38,6 +38,11 @@ from mypy_extensions import TypedDict
 from paasta_tools import marathon_tools
 from paasta_tools.utils import get_user_agent
 
+try:
+    from yaml.cyaml import CSafeLoader as Loader
+except ImportError:  # pragma: no cover (no libyaml-dev / pypy)
+    Loader = yaml.SafeLoader  # type: ignore
+
 
 class EnvoyBackend(TypedDict, total=False):
     address: str
@@ -153,7 +158,9 @@ def get_backends_from_eds(namespace: str, envoy_eds_path: str) -> List[Tuple[str
 
     if os.access(eds_file_for_namespace, os.R_OK):
         with open(eds_file_for_namespace) as f:
-            eds_yaml = yaml.safe_load(f)
+            # EDS files list every endpoint of a namespace and are parsed on
+            # each proxy healthcheck, so use the libyaml loader when available
+            eds_yaml = yaml.load(f, Loader=Loader)
             for resource in eds_yaml.get("resources", []):
                 endpoints = resource.get("endpoints")
                 # endpoints could be None if there are no backends listed
@@ -1,7 +1,10 @@
 import asyncio
+import functools
 from collections import defaultdict
+from datetime import timezone
 from enum import Enum
 from typing import Any
+from typing import Callable
 from typing import DefaultDict
 from typing import Dict
 from typing import Iterable
@@ -12,13 +15,15 @@ from typing import Optional
 from typing import Sequence
 from typing import Set
 from typing import Tuple
+from typing import Union
 
 import a_sync
-import pytz
-from kubernetes.client import V1Container
 from kubernetes.client import V1ControllerRevision
+from kubernetes.client import V1Deployment
+from kubernetes.client import V1Node
 from kubernetes.client import V1Pod
 from kubernetes.client import V1ReplicaSet
+from kubernetes.client import V1StatefulSet
 from kubernetes.client.rest import ApiException
 from mypy_extensions import TypedDict
 
@@ -31,6 +36,7 @@ from paasta_tools import marathon_tools
 from paasta_tools import nrtsearchservice_tools
 from paasta_tools import smartstack_tools
 from paasta_tools.cli.utils import LONG_RUNNING_INSTANCE_TYPE_HANDLERS
+from paasta_tools.envoy_tools import EnvoyBackend
 from paasta_tools.instance.hpa_metrics_parser import HPAMetricsDict
 from paasta_tools.instance.hpa_metrics_parser import HPAMetricsParser
 from paasta_tools.kubernetes_tools import get_pod_event_messages
@@ -55,6 +61,9 @@ INSTANCE_TYPE_CR_ID = dict(
     nrtsearchservice=nrtsearchservice_tools.cr_id,
 )
 
+# Maximum number of pods whose events and logs are fetched concurrently
+POD_INFO_CONCURRENCY = 20
+
 
 class ServiceMesh(Enum):
     SMARTSTACK = "smartstack"
@@ -160,8 +169,8 @@ def autoscaling_status(
     metric_stats = list(metrics_by_name.values())
 
     last_scale_time = (
-        hpa.status.last_scale_time.replace(tzinfo=pytz.UTC).isoformat()
-        if getattr(hpa.status, "last_scale_time")
+        hpa.status.last_scale_time.replace(tzinfo=timezone.utc).isoformat()
+        if getattr(hpa.status, "last_scale_time", None)
         else "N/A"
     )
 
@@ -178,15 +187,18 @@ async def pod_info(
     pod: V1Pod, client: kubernetes_tools.KubeClient, num_tail_lines: int,
 ):
     container_statuses = pod.status.container_statuses or []
-    pod_event_messages = await get_pod_event_messages(client, pod)
-    containers = [
-        dict(
-            name=container.name,
-            tail_lines=await get_tail_lines_for_kubernetes_container(
+    pod_event_messages, *container_tail_lines = await asyncio.gather(
+        get_pod_event_messages(client, pod),
+        *[
+            get_tail_lines_for_kubernetes_container(
                 client, pod, container, num_tail_lines,
-            ),
-        )
-        for container in container_statuses
+            )
+            for container in container_statuses
+        ],
+    )
+    containers = [
+        dict(name=container.name, tail_lines=tail_lines)
+        for container, tail_lines in zip(container_statuses, container_tail_lines)
     ]
     return {
         "name": pod.metadata.name,
@@ -212,16 +224,29 @@ async def job_status(
     replicaset_list: Sequence[V1ReplicaSet],
     verbose: int,
     namespace: str,
+    app: Union[V1Deployment, V1StatefulSet],
 ) -> None:
-    app_id = job_config.get_sanitised_deployment_name()
-    kstatus["app_id"] = app_id
+    """Fills ``kstatus`` with the status of a long running job's pods,
+    replicasets and deployment.
+
+    :param app: the job's Deployment/StatefulSet, as already fetched by the caller
+    """
+    kstatus["app_id"] = job_config.get_sanitised_deployment_name()
     kstatus["pods"] = []
     kstatus["replicasets"] = []
 
     if verbose > 0:
         num_tail_lines = calculate_tail_lines(verbose)
+        # Bound how many pods are queried at once so that large services don't
+        # flood the apiserver with event and log requests
+        pod_info_semaphore = asyncio.Semaphore(POD_INFO_CONCURRENCY)
+
+        async def bounded_pod_info(pod: V1Pod) -> Dict[str, Any]:
+            async with pod_info_semaphore:
+                return await pod_info(pod, client, num_tail_lines)
+
         kstatus["pods"] = await asyncio.gather(
-            *[pod_info(pod, client, num_tail_lines) for pod in pod_list]
+            *[bounded_pod_info(pod) for pod in pod_list]
         )
 
     for replicaset in replicaset_list:
@@ -240,9 +265,6 @@ async def job_status(
 
     kstatus["expected_instance_count"] = job_config.get_instances()
 
-    app = kubernetes_tools.get_kubernetes_app_by_name(
-        name=app_id, kube_client=client, namespace=namespace
-    )
     desired_instances = (
         job_config.get_instances() if job_config.get_desired_state() != "stop" else 0
     )
@@ -260,7 +282,7 @@ async def job_status(
     kstatus["namespace"] = app.metadata.namespace
 
 
-def mesh_status(
+async def mesh_status(
     service: str,
     service_mesh: ServiceMesh,
     instance: str,
@@ -269,14 +291,42 @@ def mesh_status(
     pods: Sequence[V1Pod],
     settings: Any,
     should_return_individual_backends: bool = False,
+    nodes: Optional[Sequence[V1Node]] = None,
 ) -> Mapping[str, Any]:
+    # The setup makes blocking calls of its own, so it runs on the executor,
+    # but it returns before any location is fetched: no executor thread ever
+    # waits on work queued behind it.
+    status, location_dict_builders = await a_sync.to_async(
+        _get_mesh_status_location_dict_builders
+    )(
+        service=service,
+        service_mesh=service_mesh,
+        job_config=job_config,
+        pods=pods,
+        settings=settings,
+        should_return_individual_backends=should_return_individual_backends,
+        nodes=nodes,
+    )
+    status["locations"].extend(await build_location_dicts(location_dict_builders))
+    return status
+
 
+def _get_mesh_status_location_dict_builders(
+    service: str,
+    service_mesh: ServiceMesh,
+    job_config: LongRunningServiceConfig,
+    pods: Sequence[V1Pod],
+    settings: Any,
+    should_return_individual_backends: bool,
+    nodes: Optional[Sequence[V1Node]],
+) -> Tuple[MutableMapping[str, Any], List[Callable[[], MutableMapping[str, Any]]]]:
     registration = job_config.get_registrations()[0]
     instance_pool = job_config.get_pool()
 
+    if nodes is None:
+        nodes = kubernetes_tools.get_all_nodes(settings.kubernetes_client)
     replication_checker = KubeSmartstackEnvoyReplicationChecker(
-        nodes=kubernetes_tools.get_all_nodes(settings.kubernetes_client),
-        system_paasta_config=settings.system_paasta_config,
+        nodes=nodes, system_paasta_config=settings.system_paasta_config,
     )
     node_hostname_by_location = replication_checker.get_allowed_locations_and_hosts(
         job_config
@@ -297,11 +347,13 @@ def mesh_status(
         "locations": [],
     }
 
+    location_dict_builders = []
     for location, hosts in node_hostname_by_location.items():
         host = replication_checker.get_first_host_in_pool(hosts, instance_pool)
         if service_mesh == ServiceMesh.SMARTSTACK:
-            mesh_status["locations"].append(
-                _build_smartstack_location_dict(
+            location_dict_builders.append(
+                functools.partial(
+                    _build_smartstack_location_dict,
                     synapse_host=host,
                     synapse_port=settings.system_paasta_config.get_synapse_port(),
                     synapse_haproxy_url_format=settings.system_paasta_config.get_synapse_haproxy_url_format(),
@@ -312,8 +364,9 @@ def mesh_status(
                 )
             )
         elif service_mesh == ServiceMesh.ENVOY:
-            mesh_status["locations"].append(
-                _build_envoy_location_dict(
+            location_dict_builders.append(
+                functools.partial(
+                    _build_envoy_location_dict,
                     envoy_host=host,
                     envoy_admin_port=settings.system_paasta_config.get_envoy_admin_port(),
                     envoy_admin_endpoint_format=settings.system_paasta_config.get_envoy_admin_endpoint_format(),
@@ -323,7 +376,18 @@ def mesh_status(
                     should_return_individual_backends=should_return_individual_backends,
                 )
             )
-    return mesh_status
+
+    return mesh_status, location_dict_builders
+
+
+async def build_location_dicts(
+    location_dict_builders: Sequence[Callable[[], MutableMapping[str, Any]]],
+) -> List[MutableMapping[str, Any]]:
+    # Each location is a separate HTTP call to synapse/envoy, so fetch them
+    # concurrently rather than one location after another
+    return await asyncio.gather(
+        *[a_sync.to_async(builder)() for builder in location_dict_builders]
+    )
 
 
 def _build_envoy_location_dict(
@@ -341,20 +405,14 @@ def _build_envoy_location_dict(
         envoy_admin_port=envoy_admin_port,
         envoy_admin_endpoint_format=envoy_admin_endpoint_format,
     )
-    sorted_envoy_backends = sorted(
-        [
-            backend[0]
-            for _, service_backends in backends.items()
-            for backend in service_backends
-        ],
-        key=lambda backend: backend["eds_health_status"],
-    )
-    casper_proxied_backends = {
-        (backend["address"], backend["port_value"])
-        for _, service_backends in backends.items()
-        for backend, is_casper_proxied_backend in service_backends
-        if is_casper_proxied_backend
-    }
+    sorted_envoy_backends: List[EnvoyBackend] = []
+    casper_proxied_backends: Set[Tuple[str, int]] = set()
+    for service_backends in backends.values():
+        for backend, is_casper_proxied_backend in service_backends:
+            sorted_envoy_backends.append(backend)
+            if is_casper_proxied_backend:
+                casper_proxied_backends.add((backend["address"], backend["port_value"]))
+    sorted_envoy_backends.sort(key=lambda backend: backend["eds_health_status"])
 
     matched_envoy_backends_and_pods = envoy_tools.match_backends_and_pods(
         sorted_envoy_backends, pods,
@@ -417,6 +475,8 @@ def cr_status(
 def filter_actually_running_replicasets(
     replicaset_list: Sequence[V1ReplicaSet],
 ) -> List[V1ReplicaSet]:
+    # The API server can't express "spec.replicas != 0 or ready_replicas != 0"
+    # as a field selector, so this filtering has to stay client-side.
     return [
         rs
         for rs in replicaset_list
@@ -424,7 +484,8 @@ def filter_actually_running_replicasets(
     ]
 
 
-def kubernetes_status_v2(
+@a_sync.to_blocking
+async def kubernetes_status_v2(
     service: str,
     instance: str,
     verbose: int,
@@ -454,30 +515,61 @@ def kubernetes_status_v2(
     )
     status["bounce_method"] = job_config.get_bounce_method()
 
-    pod_list = kubernetes_tools.pods_for_service_instance(
-        service=job_config.service,
-        instance=job_config.instance,
-        kube_client=kube_client,
-        namespace=job_config.get_kubernetes_namespace(),
-    )
-
-    service_namespace_config = kubernetes_tools.load_service_namespace_config(
+    service_namespace_config = kubernetes_tools.load_service_namespace_config_cached(
         service=service,
         namespace=job_config.get_nerve_namespace(),
         soa_dir=settings.soa_dir,
     )
-    backends = None
-    if "proxy_port" in service_namespace_config:
-        envoy_status = mesh_status(
+
+    # None of these kube API calls depend on each other, so start them all
+    # together; only the envoy lookup has to wait for pods.
+    pods_task = asyncio.ensure_future(
+        a_sync.to_async(kubernetes_tools.pods_for_service_instance_cached)(
+            service=job_config.service,
+            instance=job_config.instance,
+            kube_client=kube_client,
+            namespace=job_config.get_kubernetes_namespace(),
+        )
+    )
+    if job_config.get_persistent_volumes():
+        controllers_task = a_sync.to_async(
+            kubernetes_tools.controller_revisions_for_service_instance_cached
+        )(
+            service=job_config.service,
+            instance=job_config.instance,
+            kube_client=kube_client,
+            namespace=job_config.get_kubernetes_namespace(),
+        )
+    else:
+        controllers_task = a_sync.to_async(
+            kubernetes_tools.replicasets_for_service_instance_cached
+        )(
+            service=job_config.service,
+            instance=job_config.instance,
+            kube_client=kube_client,
+            namespace=job_config.get_kubernetes_namespace(),
+        )
+
+    async def get_envoy_status() -> Optional[Mapping[str, Any]]:
+        if "proxy_port" not in service_namespace_config:
+            return None
+        return await mesh_status(
             service=service,
             service_mesh=ServiceMesh.ENVOY,
             instance=job_config.get_nerve_namespace(),
             job_config=job_config,
             service_namespace_config=service_namespace_config,
-            pods=pod_list,
+            pods=await pods_task,
             should_return_individual_backends=True,
             settings=settings,
         )
+
+    pod_list, controller_list, envoy_status = await asyncio.gather(
+        pods_task, controllers_task, get_envoy_status()
+    )
+
+    backends = None
+    if envoy_status is not None:
         if envoy_status.get("locations"):
             backends = {
                 be["address"] for be in envoy_status["locations"][0].get("backends", [])
@@ -489,24 +581,12 @@ def kubernetes_status_v2(
             status["envoy"] = envoy_status
 
     if job_config.get_persistent_volumes():
-        controller_revision_list = kubernetes_tools.controller_revisions_for_service_instance(
-            service=job_config.service,
-            instance=job_config.instance,
-            kube_client=kube_client,
-            namespace=job_config.get_kubernetes_namespace(),
-        )
         status["versions"] = get_versions_for_controller_revisions(
-            controller_revision_list, pod_list, backends,
+            controller_list, pod_list, backends,
         )
     else:
-        replicaset_list = kubernetes_tools.replicasets_for_service_instance(
-            service=job_config.service,
-            instance=job_config.instance,
-            kube_client=kube_client,
-            namespace=job_config.get_kubernetes_namespace(),
-        )
         status["versions"] = get_versions_for_replicasets(
-            replicaset_list, pod_list, backends,
+            controller_list, pod_list, backends,
         )
 
     return status
@@ -532,9 +612,11 @@ def get_versions_for_replicasets(
 def get_pods_by_replicaset(pods: Sequence[V1Pod]) -> Dict[str, List[V1Pod]]:
     pods_by_replicaset: DefaultDict[str, List[V1Pod]] = defaultdict(list)
     for pod in pods:
-        for owner_reference in pod.metadata.owner_references:
+        for owner_reference in pod.metadata.owner_references or ():
             if owner_reference.kind == "ReplicaSet":
+                # A pod is controlled by at most one ReplicaSet
                 pods_by_replicaset[owner_reference.name].append(pod)
+                break
 
     return pods_by_replicaset
 
@@ -542,27 +624,28 @@ def get_pods_by_replicaset(pods: Sequence[V1Pod]) -> Dict[str, List[V1Pod]]:
 def get_replicaset_status(
     replicaset: V1ReplicaSet, pods: Sequence[V1Pod], backends: Optional[Set[str]],
 ) -> KubernetesVersionDict:
+    metadata = replicaset.metadata
     return {
-        "name": replicaset.metadata.name,
+        "name": metadata.name,
         "type": "ReplicaSet",
         "replicas": replicaset.spec.replicas,
         "ready_replicas": ready_replicas_from_replicaset(replicaset),
-        "create_timestamp": replicaset.metadata.creation_timestamp.timestamp(),
-        "git_sha": replicaset.metadata.labels.get("paasta.yelp.com/git_sha"),
-        "config_sha": replicaset.metadata.labels.get("paasta.yelp.com/config_sha"),
+        "create_timestamp": metadata.creation_timestamp.timestamp(),
+        "git_sha": metadata.labels.get("paasta.yelp.com/git_sha"),
+        "config_sha": metadata.labels.get("paasta.yelp.com/config_sha"),
         "pods": [get_pod_status(pod, backends) for pod in pods],
     }
 
 
 def get_pod_status(pod: V1Pod, backends: Optional[Set[str]],) -> Dict[str, Any]:
-    reason = pod.status.reason
-    message = pod.status.message
+    metadata = pod.metadata
+    pod_status = pod.status
+    reason = pod_status.reason
+    message = pod_status.message
     scheduled = kubernetes_tools.is_pod_scheduled(pod)
     ready = kubernetes_tools.is_pod_ready(pod)
     delete_timestamp = (
-        pod.metadata.deletion_timestamp.timestamp()
-        if pod.metadata.deletion_timestamp
-        else None
+        metadata.deletion_timestamp.timestamp() if metadata.deletion_timestamp else None
     )
 
     if not scheduled:
@@ -573,19 +656,19 @@ def get_pod_status(pod: V1Pod, backends: Optional[Set[str]],) -> Dict[str, Any]:
     if ready and backends is not None:
         # Replace readiness with whether or not it is actually registered in the mesh
         # TODO: Replace this once k8s readiness reflects mesh readiness, PAASTA-17266
-        ready = pod.status.pod_ip in backends
+        ready = pod_status.pod_ip in backends
 
     return {
-        "name": pod.metadata.name,
-        "ip": pod.status.pod_ip,
-        "host": pod.status.host_ip,
-        "phase": pod.status.phase,
+        "name": metadata.name,
+        "ip": pod_status.pod_ip,
+        "host": pod_status.host_ip,
+        "phase": pod_status.phase,
         "reason": reason,
         "message": message,
         "scheduled": scheduled,
         "ready": ready,
         "containers": get_pod_containers(pod),
-        "create_timestamp": pod.metadata.creation_timestamp.timestamp(),
+        "create_timestamp": metadata.creation_timestamp.timestamp(),
         "delete_timestamp": delete_timestamp,
     }
 
@@ -593,48 +676,51 @@ def get_pod_status(pod: V1Pod, backends: Optional[Set[str]],) -> Dict[str, Any]:
 def get_pod_containers(pod: V1Pod) -> List[Dict[str, Any]]:
     containers = []
     statuses = pod.status.container_statuses or []
-    container_specs = pod.spec.containers
+    # Container names are unique within a pod, so index the specs once
+    # instead of scanning them for every status
+    grace_period_by_name: Dict[str, Optional[int]] = {}
+    for spec in pod.spec.containers or []:
+        grace_period_by_name[spec.name] = (
+            spec.liveness_probe.initial_delay_seconds if spec.liveness_probe else None
+        )
     for cs in statuses:
-        specs: List[V1Container] = [c for c in container_specs if c.name == cs.name]
-        healthcheck_grace_period = None
-        if specs:
-            # There should be only one matching spec
-            spec = specs[0]
-            if spec.liveness_probe:
-                healthcheck_grace_period = spec.liveness_probe.initial_delay_seconds
-
-        state_dict = cs.state.to_dict()
+        healthcheck_grace_period = grace_period_by_name.get(cs.name)
+
+        # Each container has only one populated state at a time
         state = None
         reason = None
         message = None
         start_timestamp = None
-        for state_name, this_state in state_dict.items():
-            # Each container has only populated state at a time
-            if this_state:
-                state = state_name
-                if "reason" in this_state:
-                    reason = this_state["reason"]
-                if "message" in this_state:
-                    message = this_state["message"]
-                if "started_at" in this_state:
-                    start_timestamp = this_state["started_at"]
-
-        last_state_dict = cs.last_state.to_dict()
+        if cs.state.running:
+            state = "running"
+            start_timestamp = cs.state.running.started_at
+        elif cs.state.waiting:
+            state = "waiting"
+            reason = cs.state.waiting.reason
+            message = cs.state.waiting.message
+        elif cs.state.terminated:
+            state = "terminated"
+            reason = cs.state.terminated.reason
+            message = cs.state.terminated.message
+            start_timestamp = cs.state.terminated.started_at
+
         last_state = None
         last_reason = None
         last_message = None
         last_duration = None
-        for state_name, this_state in last_state_dict.items():
-            if this_state:
-                last_state = state_name
-                if "reason" in this_state:
-                    last_reason = this_state["reason"]
-                if "message" in this_state:
-                    last_message = this_state["message"]
-                if "started_at" in this_state and "finished_at":
-                    last_duration = (
-                        this_state["finished_at"] - this_state["started_at"]
-                    ).seconds
+        if cs.last_state.running:
+            last_state = "running"
+        elif cs.last_state.waiting:
+            last_state = "waiting"
+            last_reason = cs.last_state.waiting.reason
+            last_message = cs.last_state.waiting.message
+        elif cs.last_state.terminated:
+            last_state = "terminated"
+            terminated = cs.last_state.terminated
+            last_reason = terminated.reason
+            last_message = terminated.message
+            if terminated.started_at and terminated.finished_at:
+                last_duration = (terminated.finished_at - terminated.started_at).seconds
 
         containers.append(
             {
@@ -663,34 +749,40 @@ def get_versions_for_controller_revisions(
 
     cr_by_shas: Dict[Tuple[str, str], V1ControllerRevision] = {}
     for cr in controller_revisions:
-        git_sha = cr.metadata.labels["paasta.yelp.com/git_sha"]
-        config_sha = cr.metadata.labels["paasta.yelp.com/config_sha"]
+        labels = cr.metadata.labels
+        git_sha = labels["paasta.yelp.com/git_sha"]
+        config_sha = labels["paasta.yelp.com/config_sha"]
         cr_by_shas[(git_sha, config_sha)] = cr
 
     pods_by_shas: DefaultDict[Tuple[str, str], List[V1Pod]] = defaultdict(list)
     for pod in pods:
-        git_sha = pod.metadata.labels["paasta.yelp.com/git_sha"]
-        config_sha = pod.metadata.labels["paasta.yelp.com/config_sha"]
+        labels = pod.metadata.labels
+        git_sha = labels["paasta.yelp.com/git_sha"]
+        config_sha = labels["paasta.yelp.com/config_sha"]
         pods_by_shas[(git_sha, config_sha)].append(pod)
 
-    for (git_sha, config_sha), cr in cr_by_shas.items():
-        pods = pods_by_shas[(git_sha, config_sha)]
-        versions.append(get_version_for_controller_revision(cr, pods, backends),)
+    for shas, cr in cr_by_shas.items():
+        versions.append(
+            get_version_for_controller_revision(
+                cr, pods_by_shas.get(shas, []), backends
+            )
+        )
     return versions
 
 
 def get_version_for_controller_revision(
     cr: V1ControllerRevision, pods: Sequence[V1Pod], backends: Optional[Set[str]],
 ) -> KubernetesVersionDict:
+    metadata = cr.metadata
     ready_pods = [pod for pod in pods if kubernetes_tools.is_pod_ready(pod)]
     return {
-        "name": cr.metadata.name,
+        "name": metadata.name,
         "type": "ControllerRevision",
         "replicas": len(pods),
         "ready_replicas": len(ready_pods),
-        "create_timestamp": cr.metadata.creation_timestamp.timestamp(),
-        "git_sha": cr.metadata.labels.get("paasta.yelp.com/git_sha"),
-        "config_sha": cr.metadata.labels.get("paasta.yelp.com/config_sha"),
+        "create_timestamp": metadata.creation_timestamp.timestamp(),
+        "git_sha": metadata.labels.get("paasta.yelp.com/git_sha"),
+        "config_sha": metadata.labels.get("paasta.yelp.com/config_sha"),
         "pods": [get_pod_status(pod, backends) for pod in pods],
     }
 
@@ -717,24 +809,35 @@ def kubernetes_status(
     if kube_client is None:
         return kstatus
 
-    app = kubernetes_tools.get_kubernetes_app_by_name(
-        name=job_config.get_sanitised_deployment_name(),
-        kube_client=kube_client,
-        namespace=job_config.get_kubernetes_namespace(),
-    )
-    # bouncing status can be inferred from app_count, ref get_bouncing_status
-    pod_list = kubernetes_tools.pods_for_service_instance(
-        service=job_config.service,
-        instance=job_config.instance,
-        kube_client=kube_client,
-        namespace=job_config.get_kubernetes_namespace(),
-    )
-    replicaset_list = kubernetes_tools.replicasets_for_service_instance(
-        service=job_config.service,
-        instance=job_config.instance,
-        kube_client=kube_client,
-        namespace=job_config.get_kubernetes_namespace(),
-    )
+    namespace = job_config.get_kubernetes_namespace()
+
+    # The app, pods and replicasets are independent API calls, so make them
+    # concurrently
+    async def get_app_pods_and_replicasets() -> Tuple[
+        Union[V1Deployment, V1StatefulSet], Sequence[V1Pod], Sequence[V1ReplicaSet]
+    ]:
+        return await asyncio.gather(
+            a_sync.to_async(kubernetes_tools.get_kubernetes_app_by_name)(
+                name=job_config.get_sanitised_deployment_name(),
+                kube_client=kube_client,
+                namespace=namespace,
+            ),
+            # bouncing status can be inferred from app_count, ref get_bouncing_status
+            a_sync.to_async(kubernetes_tools.pods_for_service_instance_cached)(
+                service=job_config.service,
+                instance=job_config.instance,
+                kube_client=kube_client,
+                namespace=namespace,
+            ),
+            a_sync.to_async(kubernetes_tools.replicasets_for_service_instance_cached)(
+                service=job_config.service,
+                instance=job_config.instance,
+                kube_client=kube_client,
+                namespace=namespace,
+            ),
+        )
+
+    app, pod_list, replicaset_list = a_sync.block(get_app_pods_and_replicasets)
     # For the purpose of active_shas/app_count, don't count replicasets that are at 0/0.
     actually_running_replicasets = filter_actually_running_replicasets(replicaset_list)
     active_shas = kubernetes_tools.get_active_shas_for_service(
@@ -753,6 +856,7 @@ def kubernetes_status(
         verbose=verbose,
         pod_list=pod_list,
         replicaset_list=replicaset_list,
+        app=app,
     )
 
     if (
@@ -775,14 +879,15 @@ def kubernetes_status(
     kstatus["evicted_count"] = evicted_count
 
     if include_smartstack or include_envoy:
-        service_namespace_config = kubernetes_tools.load_service_namespace_config(
+        service_namespace_config = kubernetes_tools.load_service_namespace_config_cached(
             service=service,
             namespace=job_config.get_nerve_namespace(),
             soa_dir=settings.soa_dir,
         )
         if "proxy_port" in service_namespace_config:
             if include_smartstack:
-                kstatus["smartstack"] = mesh_status(
+                kstatus["smartstack"] = a_sync.block(
+                    mesh_status,
                     service=service,
                     service_mesh=ServiceMesh.SMARTSTACK,
                     instance=job_config.get_nerve_namespace(),
@@ -793,7 +898,8 @@ def kubernetes_status(
                     settings=settings,
                 )
             if include_envoy:
-                kstatus["envoy"] = mesh_status(
+                kstatus["envoy"] = a_sync.block(
+                    mesh_status,
                     service=service,
                     service_mesh=ServiceMesh.ENVOY,
                     instance=job_config.get_nerve_namespace(),
@@ -859,14 +965,10 @@ def instance_status(
 
 
 def ready_replicas_from_replicaset(replicaset: V1ReplicaSet) -> int:
-    try:
-        ready_replicas = replicaset.status.ready_replicas
-        if ready_replicas is None:
-            ready_replicas = 0
-    except AttributeError:
-        ready_replicas = 0
-
-    return ready_replicas
+    # status, and ready_replicas within it, are unset until the controller
+    # has reported on the ReplicaSet
+    status = getattr(replicaset, "status", None)
+    return getattr(status, "ready_replicas", None) or 0
 
 
 def kubernetes_mesh_status(
@@ -893,7 +995,7 @@ def kubernetes_mesh_status(
         soa_dir=settings.soa_dir,
         load_deployments=True,
     )
-    service_namespace_config = kubernetes_tools.load_service_namespace_config(
+    service_namespace_config = kubernetes_tools.load_service_namespace_config_cached(
         service=service,
         namespace=job_config.get_nerve_namespace(),
         soa_dir=settings.soa_dir,
@@ -904,12 +1006,25 @@ def kubernetes_mesh_status(
         )
 
     kube_client = settings.kubernetes_client
-    pod_list = kubernetes_tools.pods_for_service_instance(
-        service=job_config.service,
-        instance=job_config.instance,
-        kube_client=kube_client,
-        namespace=job_config.get_kubernetes_namespace(),
-    )
+
+    # The node list is shared by every mesh queried below, and neither LIST
+    # depends on the other, so make both calls at once. Backends are matched
+    # to pods by IP, so only running pods are needed; letting the apiserver
+    # drop the rest keeps the response small and stops a finished pod whose
+    # IP has been reused from being matched to a live backend.
+    async def get_pods_and_nodes() -> Tuple[Sequence[V1Pod], Sequence[V1Node]]:
+        return await asyncio.gather(
+            a_sync.to_async(kubernetes_tools.pods_for_service_instance_cached)(
+                service=job_config.service,
+                instance=job_config.instance,
+                kube_client=kube_client,
+                namespace=job_config.get_kubernetes_namespace(),
+                field_selector="status.phase=Running",
+            ),
+            a_sync.to_async(kubernetes_tools.get_all_nodes)(kube_client),
+        )
+
+    pod_list, nodes = a_sync.block(get_pods_and_nodes)
 
     kmesh: Dict[str, Any] = {}
     mesh_status_kwargs = dict(
@@ -920,14 +1035,25 @@ def kubernetes_mesh_status(
         pods=pod_list,
         should_return_individual_backends=True,
         settings=settings,
+        nodes=nodes,
     )
+    service_meshes = []
     if include_smartstack:
-        kmesh["smartstack"] = mesh_status(
-            service_mesh=ServiceMesh.SMARTSTACK, **mesh_status_kwargs,
-        )
+        service_meshes.append(ServiceMesh.SMARTSTACK)
     if include_envoy:
-        kmesh["envoy"] = mesh_status(
-            service_mesh=ServiceMesh.ENVOY, **mesh_status_kwargs,
+        service_meshes.append(ServiceMesh.ENVOY)
+
+    # Smartstack and envoy are queried through separate endpoints, so there is
+    # no need to wait for one before asking the other
+    async def get_mesh_statuses() -> List[Mapping[str, Any]]:
+        return await asyncio.gather(
+            *[
+                mesh_status(service_mesh=service_mesh, **mesh_status_kwargs)
+                for service_mesh in service_meshes
+            ]
         )
 
+    for service_mesh, status in zip(service_meshes, a_sync.block(get_mesh_statuses)):
+        kmesh[service_mesh.value] = status
+
     return kmesh
@@ -382,6 +382,18 @@ def load_kubernetes_service_config(
     )
 
 
+@time_cache(ttl=5)
+def load_service_namespace_config_cached(
+    service: str, namespace: str, soa_dir: str = DEFAULT_SOA_DIR
+) -> ServiceNamespaceConfig:
+    """Like load_service_namespace_config, but cached for a few seconds so that
+    repeated status requests for the same instance don't re-read smartstack.yaml.
+    Callers must not mutate the returned config."""
+    return load_service_namespace_config(
+        service=service, namespace=namespace, soa_dir=soa_dir
+    )
+
+
 class InvalidKubernetesConfig(Exception):
     def __init__(self, exception: Exception, service: str, instance: str) -> None:
         super().__init__(
@@ -402,14 +414,18 @@ class KubeClient:
             fset=_set_disrupted_pods,
         )
 
-        self.deployments = kube_client.AppsV1Api()
-        self.core = kube_client.CoreV1Api()
-        self.policy = kube_client.PolicyV1beta1Api()
-        self.apiextensions = kube_client.ApiextensionsV1beta1Api()
-        self.custom = kube_client.CustomObjectsApi()
-        self.autoscaling = kube_client.AutoscalingV2beta2Api()
-
+        # Every API group shares one ApiClient, and so one urllib3 pool, so
+        # that calls to different groups reuse already-established TLS
+        # connections to the apiserver instead of each group opening its own.
         self.api_client = kube_client.ApiClient()
+
+        self.deployments = kube_client.AppsV1Api(self.api_client)
+        self.core = kube_client.CoreV1Api(self.api_client)
+        self.policy = kube_client.PolicyV1beta1Api(self.api_client)
+        self.apiextensions = kube_client.ApiextensionsV1beta1Api(self.api_client)
+        self.custom = kube_client.CustomObjectsApi(self.api_client)
+        self.autoscaling = kube_client.AutoscalingV2beta2Api(self.api_client)
+
         self.request = self.api_client.request
         # This function is used by the k8s client to serialize OpenAPI objects
         # into JSON before posting to the api. The JSON output can be used
@@ -2264,32 +2280,91 @@ def list_matching_deployments(
 
 
 def replicasets_for_service_instance(
-    service: str, instance: str, kube_client: KubeClient, namespace: str = "paasta"
+    service: str,
+    instance: str,
+    kube_client: KubeClient,
+    namespace: str = "paasta",
+    resource_version: Optional[str] = None,
 ) -> Sequence[V1ReplicaSet]:
     return kube_client.deployments.list_namespaced_replica_set(
         label_selector=f"paasta.yelp.com/service={service},paasta.yelp.com/instance={instance}",
         namespace=namespace,
+        resource_version=resource_version,
     ).items
 
 
 def controller_revisions_for_service_instance(
-    service: str, instance: str, kube_client: KubeClient, namespace: str = "paasta"
+    service: str,
+    instance: str,
+    kube_client: KubeClient,
+    namespace: str = "paasta",
+    resource_version: Optional[str] = None,
 ) -> Sequence[V1ControllerRevision]:
     return kube_client.deployments.list_namespaced_controller_revision(
         label_selector=f"paasta.yelp.com/service={service},paasta.yelp.com/instance={instance}",
         namespace=namespace,
+        resource_version=resource_version,
     ).items
 
 
 def pods_for_service_instance(
-    service: str, instance: str, kube_client: KubeClient, namespace: str = "paasta"
+    service: str,
+    instance: str,
+    kube_client: KubeClient,
+    namespace: str = "paasta",
+    resource_version: Optional[str] = None,
+    field_selector: Optional[str] = None,
 ) -> Sequence[V1Pod]:
     return kube_client.core.list_namespaced_pod(
         label_selector=f"paasta.yelp.com/service={service},paasta.yelp.com/instance={instance}",
         namespace=namespace,
+        resource_version=resource_version,
+        field_selector=field_selector,
     ).items
 
 
+# The paasta API serves status for the same service instances over and over
+# while they are being watched. These short-lived caches let repeated status
+# requests share one set of list calls instead of each hitting the apiserver.
+# They also list with resourceVersion=0, which lets the apiserver answer from
+# its watch cache rather than doing a quorum read from etcd; status output can
+# tolerate that small amount of staleness.
+@time_cache(ttl=5)
+def pods_for_service_instance_cached(
+    service: str,
+    instance: str,
+    kube_client: KubeClient,
+    namespace: str = "paasta",
+    field_selector: Optional[str] = None,
+) -> Sequence[V1Pod]:
+    return pods_for_service_instance(
+        service,
+        instance,
+        kube_client,
+        namespace,
+        resource_version="0",
+        field_selector=field_selector,
+    )
+
+
+@time_cache(ttl=5)
+def replicasets_for_service_instance_cached(
+    service: str, instance: str, kube_client: KubeClient, namespace: str = "paasta"
+) -> Sequence[V1ReplicaSet]:
+    return replicasets_for_service_instance(
+        service, instance, kube_client, namespace, resource_version="0"
+    )
+
+
+@time_cache(ttl=5)
+def controller_revisions_for_service_instance_cached(
+    service: str, instance: str, kube_client: KubeClient, namespace: str = "paasta"
+) -> Sequence[V1ControllerRevision]:
+    return controller_revisions_for_service_instance(
+        service, instance, kube_client, namespace, resource_version="0"
+    )
+
+
 def get_pods_by_node(kube_client: KubeClient, node: V1Node) -> Sequence[V1Pod]:
     return kube_client.core.list_pod_for_all_namespaces(
         field_selector=f"spec.nodeName={node.metadata.name}"
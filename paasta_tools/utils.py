@@ -168,6 +168,19 @@ class time_cache:
     def __init__(self, ttl: float = 0) -> None:
         self.configs: Dict[Tuple, TimeCacheEntry] = {}
         self.ttl = ttl
+        self.last_eviction_time = time.time()
+
+    def evict_expired(self, now: float) -> None:
+        """Drops entries older than the ttl, so that long-running processes
+        (e.g. API workers) don't hold on to every result they ever cached."""
+        for key, entry in list(self.configs.items()):
+            if now - entry["fetch_time"] > self.ttl:
+                self.configs.pop(key, None)
+        self.last_eviction_time = now
+
+    def cache_clear(self) -> None:
+        self.configs.clear()
+        self.last_eviction_time = time.time()
 
     def __call__(self, f: Callable[..., _CacheRetT]) -> Callable[..., _CacheRetT]:
         def cache(*args: Any, **kwargs: Any) -> _CacheRetT:
@@ -179,17 +192,22 @@ class time_cache:
             key = args
             for item in kwargs.items():
                 key += item
-            if (
-                (not ttl)
-                or (key not in self.configs)
-                or (time.time() - self.configs[key]["fetch_time"] > ttl)
-            ):
-                self.configs[key] = {
+            now = time.time()
+            # Read the entry once: another thread may evict it after we check it
+            entry = self.configs.get(key)
+            if (not ttl) or (entry is None) or (now - entry["fetch_time"] > ttl):
+                # Sweeping at most once per ttl keeps the cost of a miss O(1)
+                # on average
+                if self.ttl and now - self.last_eviction_time > self.ttl:
+                    self.evict_expired(now)
+                entry = {
                     "data": f(*args, **kwargs),
                     "fetch_time": time.time(),
                 }
-            return self.configs[key]["data"]
+                self.configs[key] = entry
+            return entry["data"]
 
+        cache.cache_clear = self.cache_clear  # type: ignore
         return cache
 
 
@@ -26,6 +26,14 @@ def test_get_paasta_oapi_client(system_paasta_config):
         client = get_paasta_oapi_client()
         assert client
 
+        pool_manager = client.service.api_client.rest_client.pool_manager
+        assert pool_manager.connection_pool_kw["maxsize"] == 200
+        retries = pool_manager.connection_pool_kw["retries"]
+        assert retries.total == 2
+        assert retries.is_retry("GET", 503)
+        assert not retries.is_retry("POST", 503)
+        assert not retries.is_retry("DELETE", 503)
+
 
 def test_renew_issue_cert():
     with mock.patch(
@@ -13,6 +13,7 @@
 # limitations under the License.
 import datetime
 
+import a_sync
 import asynctest
 import mock
 import pytest
@@ -578,7 +579,8 @@ def test_kubernetes_smartstack_status(
     mock_service_namespace_config = ServiceNamespaceConfig()
     mock_settings = mock.Mock()
 
-    smartstack_status = instance.pik.mesh_status(
+    smartstack_status = a_sync.block(
+        instance.pik.mesh_status,
         service="fake_service",
         service_mesh=ServiceMesh.SMARTSTACK,
         instance="fake_instance",
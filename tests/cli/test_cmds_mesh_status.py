@@ -4,6 +4,7 @@ import pytest
 import paasta_tools.paastaapi.models as paastamodels
 from paasta_tools.cli.cmds import mesh_status
 from paasta_tools.paastaapi import ApiException
+from paasta_tools.utils import PaastaColors
 
 
 @pytest.fixture
@@ -109,3 +110,86 @@ def test_paasta_mesh_status_on_api_endpoint_error(
 
     assert mock_smtstk_status_human.call_args_list == []
     assert mock_envoy_status_human.call_args_list == []
+
+
+@pytest.mark.parametrize(
+    "exc,expected_lines",
+    [
+        (Exception("first line\nsecond line\n"), ["first line", "second line"]),
+        (Exception("one line"), ["one line"]),
+    ],
+)
+def test_paasta_mesh_status_on_api_endpoint_exception_text(
+    exc, expected_lines, mock_get_oapi_client, system_paasta_config,
+):
+    client = mock_get_oapi_client.return_value
+    client.service.mesh_instance.side_effect = [exc]
+
+    code, output = mesh_status.paasta_mesh_status_on_api_endpoint(
+        cluster="fake_cluster",
+        service="fake_service",
+        instance="fake_instance",
+        system_paasta_config=system_paasta_config,
+    )
+
+    assert code == 1
+    assert "Exception when talking to the API" in output[0]
+    assert output[1:] == expected_lines
+
+
+@mock.patch(
+    "paasta_tools.cli.cmds.mesh_status.load_system_paasta_config", autospec=True
+)
+@mock.patch("paasta_tools.cli.cmds.mesh_status.verify_instances", autospec=True)
+@mock.patch("paasta_tools.cli.cmds.mesh_status.figure_out_service_name", autospec=True)
+def test_paasta_mesh_status_invalid_instance_skips_config_load(
+    mock_figure_out_service_name, mock_verify_instances, mock_load_system_paasta_config,
+):
+    mock_figure_out_service_name.return_value = "fake_service"
+    mock_verify_instances.return_value = ["fake_instance"]
+    args = mock.Mock(
+        service="fake_service",
+        instance="fake_instance",
+        cluster="fake_cluster",
+        soa_dir="/fake/soa/dir",
+    )
+
+    assert mesh_status.paasta_mesh_status(args) == 1
+    assert mock_load_system_paasta_config.call_count == 0
+
+
+@mock.patch(
+    "paasta_tools.cli.cmds.mesh_status.load_system_paasta_config", autospec=True
+)
+@mock.patch(
+    "paasta_tools.cli.cmds.mesh_status.paasta_mesh_status_on_api_endpoint",
+    autospec=True,
+)
+@mock.patch("paasta_tools.cli.cmds.mesh_status.verify_instances", autospec=True)
+@mock.patch("paasta_tools.cli.cmds.mesh_status.figure_out_service_name", autospec=True)
+def test_paasta_mesh_status_output(
+    mock_figure_out_service_name,
+    mock_verify_instances,
+    mock_paasta_mesh_status_on_api_endpoint,
+    mock_load_system_paasta_config,
+    capfd,
+):
+    mock_figure_out_service_name.return_value = "fake_service"
+    mock_verify_instances.return_value = []
+    mock_paasta_mesh_status_on_api_endpoint.return_value = (0, ["line1", "line2"])
+    args = mock.Mock(
+        service="fake_service",
+        instance="fake_instance",
+        cluster="fake_cluster",
+        soa_dir="/fake/soa/dir",
+    )
+
+    assert mesh_status.paasta_mesh_status(args) == 0
+    output, _ = capfd.readouterr()
+    assert output.splitlines() == [
+        "service: fake_service",
+        "cluster: fake_cluster",
+        f"instance: {PaastaColors.cyan('fake_instance')}",
+        "  line1",
+        "  line2",
+    ]
@@ -11,17 +11,20 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import argparse
+import asyncio
+import concurrent.futures
 import datetime
-from collections import defaultdict
 from typing import Any
 from typing import Dict
 from typing import Mapping
 from typing import Set
 
+import a_sync
+import asynctest
 import mock
 import pytest
 from mock import ANY
-from mock import MagicMock
 from mock import Mock
 from mock import patch
 
@@ -63,26 +66,85 @@ from tests.conftest import Struct
 def make_fake_instance_conf(
     cluster, service, instance, deploy_group=None, team=None, registrations=()
 ):
-    conf = MagicMock()
+    getters = [
+        "get_cluster",
+        "get_service",
+        "get_instance",
+        "get_deploy_group",
+        "get_team",
+    ]
+    # Configs without registrations don't have the getter at all
+    if registrations is not None:
+        getters.append("get_registrations")
+    conf = Mock(spec_set=getters)
     conf.get_cluster.return_value = cluster
     conf.get_service.return_value = service
     conf.get_instance.return_value = instance
     conf.get_deploy_group.return_value = deploy_group
     conf.get_team.return_value = team
-    conf.get_registrations.return_value = registrations if registrations else []
-    if registrations is None:
-        del (
-            conf.get_registrations
-        )  # http://www.voidspace.org.uk/python/mock/mock.html#deleting-attributes
+    if registrations is not None:
+        conf.get_registrations.return_value = list(registrations)
     return conf
 
 
+class StatusArgs:
+    def __init__(
+        self,
+        service,
+        soa_dir,
+        clusters,
+        instances,
+        deploy_group,
+        owner,
+        registration,
+        verbose,
+        service_instance=None,
+        new=False,
+    ):
+        self.service = service
+        self.soa_dir = soa_dir
+        self.clusters = clusters
+        self.instances = instances
+        self.deploy_group = deploy_group
+        self.owner = owner
+        self.registration = registration
+        self.verbose = verbose
+        self.service_instance = service_instance
+        self.new = new
+
+
+@pytest.fixture
+def status_mocks(system_paasta_config):
+    """Patches everything paasta_status and apply_args_filters look up in soa
+    configs, deployments and the API, so tests only need to set return values."""
+    with patch.multiple(
+        "paasta_tools.cli.cmds.status",
+        autospec=True,
+        list_clusters=mock.DEFAULT,
+        list_services=mock.DEFAULT,
+        figure_out_service_name=mock.DEFAULT,
+        validate_service_name=mock.DEFAULT,
+        get_instance_configs_for_service=mock.DEFAULT,
+        load_system_paasta_config=mock.DEFAULT,
+        get_actual_deployments=mock.DEFAULT,
+        get_planned_deployments=mock.DEFAULT,
+        get_deploy_info=mock.DEFAULT,
+        get_paasta_oapi_client=mock.DEFAULT,
+    ) as mocks, asynctest.patch(
+        "paasta_tools.cli.cmds.status.report_status_for_cluster", autospec=True
+    ) as mock_report_status_for_cluster:
+        # report_status_for_cluster is a coroutine function, which only
+        # asynctest knows how to autospec
+        mocks["report_status_for_cluster"] = mock_report_status_for_cluster
+        mocks["load_system_paasta_config"].return_value = system_paasta_config
+        yield Struct(**mocks)
+
+
 @patch("paasta_tools.cli.utils.validate_service_name", autospec=True)
-def test_figure_out_service_name_not_found(mock_validate_service_name, capfd):
+def test_figure_out_service_name_not_found(mock_validate_service_name, capsys):
     # paasta_status with invalid -s service_name arg results in error
     mock_validate_service_name.side_effect = NoSuchService(None)
-    parsed_args = Mock()
-    parsed_args.service = "fake_service"
+    parsed_args = argparse.Namespace(service="fake_service")
 
     expected_output = "%s\n" % NoSuchService.GUESS_ERROR_MSG
 
@@ -90,7 +152,7 @@ def test_figure_out_service_name_not_found(mock_validate_service_name, capfd):
     with pytest.raises(SystemExit) as sys_exit:
         status.figure_out_service_name(parsed_args)
 
-    output, _ = capfd.readouterr()
+    output, _ = capsys.readouterr()
     assert sys_exit.value.code == 1
     assert output == expected_output
 
@@ -106,7 +168,7 @@ def test_status_arg_service_not_found(
     mock_validate_service_name,
     mock_load_system_paasta_config,
     mock_list_clusters,
-    capfd,
+    capsys,
     system_paasta_config,
 ):
     # paasta_status with no args and non-service directory results in error
@@ -118,20 +180,22 @@ def test_status_arg_service_not_found(
     mock_load_system_paasta_config.return_value = system_paasta_config
     expected_output = str(error) + "\n"
 
-    args = MagicMock()
-    args.service = None
-    args.owner = None
-    args.clusters = None
-    args.instances = None
-    args.deploy_group = None
-    args.registration = None
-    args.service_instance = None
+    args = StatusArgs(
+        service=None,
+        soa_dir=utils.DEFAULT_SOA_DIR,
+        clusters=None,
+        instances=None,
+        deploy_group=None,
+        owner=None,
+        registration=None,
+        verbose=False,
+    )
 
     # Fail if exit(1) does not get called
     with pytest.raises(SystemExit) as sys_exit:
         paasta_status(args)
 
-    output, _ = capfd.readouterr()
+    output, _ = capsys.readouterr()
     assert sys_exit.value.code == 1
     assert output == expected_output
 
@@ -148,7 +212,8 @@ def test_report_status_calls_report_invalid_whitelist_values(
     actual_deployments: Dict[str, str] = {}
     instance_whitelist: Dict[str, Any] = {}
 
-    status.report_status_for_cluster(
+    a_sync.block(
+        status.report_status_for_cluster,
         service=service,
         cluster="cluster",
         deploy_pipeline=planned_deployments,
@@ -161,54 +226,131 @@ def test_report_status_calls_report_invalid_whitelist_values(
     )
 
 
-@patch("paasta_tools.cli.cmds.status.get_instance_configs_for_service", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_services", autospec=True)
-@patch("paasta_tools.cli.cmds.status.load_system_paasta_config", autospec=True)
-@patch("paasta_tools.cli.cmds.status.figure_out_service_name", autospec=True)
-@patch("paasta_tools.cli.cmds.status.get_deploy_info", autospec=True)
-@patch("paasta_tools.cli.cmds.status.get_actual_deployments", autospec=True)
-@patch("paasta_tools.cli.cmds.status.validate_service_name", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_clusters", autospec=True)
-def test_status_pending_pipeline_build_message(
-    mock_list_clusters,
-    mock_validate_service_name,
-    mock_get_actual_deployments,
-    mock_get_deploy_info,
-    mock_figure_out_service_name,
-    mock_load_system_paasta_config,
-    mock_list_services,
-    mock_get_instance_configs_for_service,
-    capfd,
-    system_paasta_config,
+@patch("paasta_tools.cli.cmds.status.paasta_status_on_api_endpoint", autospec=True)
+def test_report_status_for_cluster_keeps_instance_order(
+    mock_paasta_status_on_api_endpoint, system_paasta_config,
 ):
+    def fake_status_on_api_endpoint(instance, output, **kwargs):
+        output.append(f"instance: {instance}")
+        return 1 if instance == "instance2" else 0
+
+    mock_paasta_status_on_api_endpoint.side_effect = fake_status_on_api_endpoint
+
+    return_code, output = a_sync.block(
+        status.report_status_for_cluster,
+        service="fake_service",
+        cluster="cluster",
+        deploy_pipeline=["cluster.instance1", "cluster.instance2", "cluster.instance3"],
+        actual_deployments={
+            "cluster.instance1": "this_is_a_sha",
+            "cluster.instance2": "this_is_a_sha",
+            "cluster.instance3": "this_is_a_sha",
+        },
+        instance_whitelist={
+            "instance1": marathon_tools.MarathonServiceConfig,
+            "instance2": marathon_tools.MarathonServiceConfig,
+            "instance3": marathon_tools.MarathonServiceConfig,
+        },
+        system_paasta_config=system_paasta_config,
+    )
+
+    assert return_code == 1
+    assert [line for line in output if line.startswith("instance:")] == [
+        "instance: instance1",
+        "instance: instance2",
+        "instance: instance3",
+    ]
+
+
+@patch("paasta_tools.cli.cmds.status.get_paasta_oapi_client", autospec=True)
+def test_memoized_oapi_client_getter(mock_get_paasta_oapi_client, system_paasta_config):
+    mock_get_paasta_oapi_client.side_effect = lambda cluster, config: Mock(
+        cluster=cluster
+    )
+    get_client = status.memoized_oapi_client_getter()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        clients = list(
+            executor.map(
+                lambda cluster: get_client(cluster, system_paasta_config),
+                ["cluster1", "cluster2"] * 4,
+            )
+        )
+
+    assert [client.cluster for client in clients] == ["cluster1", "cluster2"] * 4
+    assert len({id(client) for client in clients}) == 2
+    assert sorted(
+        call[0][0] for call in mock_get_paasta_oapi_client.call_args_list
+    ) == ["cluster1", "cluster2"]
+
+
+def test_print_cluster_statuses_prints_whole_reports(capsys):
+    async def fake_report(name, delay, executor):
+        await asyncio.sleep(delay)
+        return 0 if name == "fast" else 1, [f"{name} 1", f"{name} 2"]
+
+    tasks = [
+        (fake_report, dict(name="slow", delay=0.01)),
+        (fake_report, dict(name="fast", delay=0)),
+    ]
+    return_codes = a_sync.block(status.print_cluster_statuses, tasks, 2)
+
+    assert return_codes == [0, 1]
+    printed, _ = capsys.readouterr()
+    assert printed.split("\n") == ["fast 1", "fast 2", "slow 1", "slow 2", ""]
+
+
+@pytest.mark.parametrize(
+    "call_count,env,expected",
+    [
+        (0, {}, 1),
+        (3, {}, 3),
+        (1000, {}, status.DEFAULT_STATUS_CONCURRENCY),
+        (1000, {"PAASTA_STATUS_CONCURRENCY": "50"}, 50),
+    ],
+)
+def test_get_status_concurrency(call_count, env, expected):
+    with patch.dict("os.environ", env):
+        assert status.get_status_concurrency(call_count) == expected
+
+
+@pytest.mark.parametrize("configured_cap", ["fifty", "0", "-3"])
+def test_get_status_concurrency_invalid_env(configured_cap, capsys):
+    with patch.dict("os.environ", {"PAASTA_STATUS_CONCURRENCY": configured_cap}):
+        assert status.get_status_concurrency(1000) == status.DEFAULT_STATUS_CONCURRENCY
+    _, err = capsys.readouterr()
+    assert "PAASTA_STATUS_CONCURRENCY" in err
+
+
+def test_status_pending_pipeline_build_message(status_mocks, capsys):
     # If deployments.json is missing SERVICE, output the appropriate message
     service = "fake_service"
-    mock_list_clusters.return_value = ["cluster"]
-    mock_validate_service_name.return_value = None
-    mock_figure_out_service_name.return_value = service
-    mock_list_services.return_value = [service]
+    status_mocks.list_clusters.return_value = ["cluster"]
+    status_mocks.validate_service_name.return_value = None
+    status_mocks.figure_out_service_name.return_value = service
+    status_mocks.list_services.return_value = [service]
     pipeline = [{"instancename": "cluster.instance"}]
-    mock_get_deploy_info.return_value = {"pipeline": pipeline}
-    mock_load_system_paasta_config.return_value = system_paasta_config
+    status_mocks.get_deploy_info.return_value = {"pipeline": pipeline}
     mock_instance_config = make_fake_instance_conf("cluster", service, "instancename")
-    mock_get_instance_configs_for_service.return_value = [mock_instance_config]
+    status_mocks.get_instance_configs_for_service.return_value = [mock_instance_config]
 
     actual_deployments: Dict[str, str] = {}
-    mock_get_actual_deployments.return_value = actual_deployments
+    status_mocks.get_actual_deployments.return_value = actual_deployments
     expected_output = missing_deployments_message(service)
 
-    args = MagicMock()
-    args.service = service
-    args.deploy_group = None
-    args.clusters = None
-    args.instances = None
-    args.owner = None
-    args.soa_dir = utils.DEFAULT_SOA_DIR
-    args.registration = None
-    args.service_instance = None
+    args = StatusArgs(
+        service=service,
+        soa_dir=utils.DEFAULT_SOA_DIR,
+        clusters=None,
+        instances=None,
+        deploy_group=None,
+        owner=None,
+        registration=None,
+        verbose=False,
+    )
 
     paasta_status(args)
-    output, _ = capfd.readouterr()
+    output, _ = capsys.readouterr()
     assert expected_output in output
 
 
@@ -242,77 +384,57 @@ def test_get_deploy_info_exists(mock_read_deploy):
 
 
 @patch("paasta_tools.cli.cmds.status.read_deploy", autospec=True)
-def test_get_deploy_info_does_not_exist(mock_read_deploy, capfd):
+def test_get_deploy_info_does_not_exist(mock_read_deploy, capsys):
     mock_read_deploy.return_value = False
     with pytest.raises(SystemExit) as sys_exit:
         status.get_deploy_info("fake_service")
-    output, _ = capfd.readouterr()
+    output, _ = capsys.readouterr()
     assert sys_exit.value.code == 1
     assert output.startswith("Error encountered with")
 
 
-@patch("paasta_tools.cli.cmds.status.get_instance_configs_for_service", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_services", autospec=True)
-@patch("paasta_tools.cli.cmds.status.load_system_paasta_config", autospec=True)
-@patch("paasta_tools.cli.cmds.status.figure_out_service_name", autospec=True)
-@patch("paasta_tools.cli.cmds.status.get_actual_deployments", autospec=True)
-@patch("paasta_tools.cli.cmds.status.get_planned_deployments", autospec=True)
-@patch("paasta_tools.cli.cmds.status.report_status_for_cluster", autospec=True)
-@patch("paasta_tools.cli.cmds.status.validate_service_name", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_clusters", autospec=True)
-def test_status_calls_sergeants(
-    mock_list_clusters,
-    mock_validate_service_name,
-    mock_report_status,
-    mock_get_planned_deployments,
-    mock_get_actual_deployments,
-    mock_figure_out_service_name,
-    mock_load_system_paasta_config,
-    mock_list_services,
-    mock_get_instance_configs_for_service,
-    system_paasta_config,
-):
+def test_status_calls_sergeants(status_mocks, system_paasta_config):
     service = "fake_service"
     cluster = "fake_cluster"
-    mock_list_clusters.return_value = ["cluster1", "cluster2", "fake_cluster"]
-    mock_validate_service_name.return_value = None
-    mock_figure_out_service_name.return_value = service
-    mock_list_services.return_value = [service]
+    status_mocks.list_clusters.return_value = ["cluster1", "cluster2", "fake_cluster"]
+    status_mocks.validate_service_name.return_value = None
+    status_mocks.figure_out_service_name.return_value = service
+    status_mocks.list_services.return_value = [service]
 
     mock_instance_config = make_fake_instance_conf(cluster, service, "fi")
     mock_instance_config.get_service.return_value = service
     mock_instance_config.get_cluster.return_value = cluster
-    mock_get_instance_configs_for_service.return_value = [mock_instance_config]
+    status_mocks.get_instance_configs_for_service.return_value = [mock_instance_config]
 
     planned_deployments = [
         "cluster1.instance1",
         "cluster1.instance2",
         "cluster2.instance1",
     ]
-    mock_get_planned_deployments.return_value = planned_deployments
+    status_mocks.get_planned_deployments.return_value = planned_deployments
 
     actual_deployments = {"fake_service:paasta-cluster.instance": "this_is_a_sha"}
-    mock_get_actual_deployments.return_value = actual_deployments
-    mock_load_system_paasta_config.return_value = system_paasta_config
-    mock_report_status.return_value = 1776, ["dummy", "output"]
-
-    args = MagicMock()
-    args.service = service
-    args.clusters = None
-    args.instances = None
-    args.verbose = False
-    args.owner = None
-    args.deploy_group = None
-    args.soa_dir = "/fake/soa/dir"
-    args.registration = None
-    args.service_instance = None
-    args.new = False
+    status_mocks.get_actual_deployments.return_value = actual_deployments
+    status_mocks.report_status_for_cluster.return_value = 1776, ["dummy", "output"]
+
+    args = StatusArgs(
+        service=service,
+        soa_dir="/fake/soa/dir",
+        clusters=None,
+        instances=None,
+        deploy_group=None,
+        owner=None,
+        registration=None,
+        verbose=False,
+    )
     return_value = paasta_status(args)
 
     assert return_value == 1776
 
-    mock_get_actual_deployments.assert_called_once_with(service, "/fake/soa/dir")
-    mock_report_status.assert_called_once_with(
+    status_mocks.get_actual_deployments.assert_called_once_with(
+        service, "/fake/soa/dir"
+    )
+    status_mocks.report_status_for_cluster.assert_called_once_with(
         service=service,
         deploy_pipeline=planned_deployments,
         actual_deployments=actual_deployments,
@@ -321,7 +443,11 @@ def test_status_calls_sergeants(
         system_paasta_config=system_paasta_config,
         verbose=False,
         new=False,
+        get_client=ANY,
+        executor=ANY,
     )
+    # clients are built lazily by the report's API calls, not up front
+    assert status_mocks.get_paasta_oapi_client.call_count == 0
 
 
 def test_report_invalid_whitelist_values_no_whitelists():
@@ -342,316 +468,154 @@ def test_report_invalid_whitelist_values_with_whitelists():
     assert "bogus1" in actual
 
 
-class StatusArgs:
-    def __init__(
-        self,
-        service,
-        soa_dir,
-        clusters,
-        instances,
-        deploy_group,
-        owner,
-        registration,
-        verbose,
-        service_instance=None,
-        new=False,
-    ):
-        self.service = service
-        self.soa_dir = soa_dir
-        self.clusters = clusters
-        self.instances = instances
-        self.deploy_group = deploy_group
-        self.owner = owner
-        self.registration = registration
-        self.verbose = verbose
-        self.service_instance = service_instance
-        self.new = new
-
-
-@patch("paasta_tools.cli.cmds.status.get_instance_configs_for_service", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_services", autospec=True)
-@patch("paasta_tools.cli.cmds.status.figure_out_service_name", autospec=True)
-@patch("paasta_tools.cli.cmds.status.validate_service_name", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_clusters", autospec=True)
-def test_apply_args_filters_clusters_and_instances_clusters_instances_deploy_group(
-    mock_list_clusters,
-    mock_validate_service_name,
-    mock_figure_out_service_name,
-    mock_list_services,
-    mock_get_instance_configs_for_service,
-):
-    args = StatusArgs(
-        service="fake_service",
-        soa_dir="/fake/soa/dir",
-        deploy_group="fake_deploy_group",
-        clusters="cluster1",
-        instances="instance1,instance3",
-        owner=None,
-        registration=None,
-        verbose=False,
-        service_instance=None,
-    )
-    mock_list_clusters.return_value = ["cluster1", "cluster2"]
-    mock_validate_service_name.return_value = None
-    mock_figure_out_service_name.return_value = "fake_service"
-    mock_list_services.return_value = ["fake_service"]
-    mock_inst1 = make_fake_instance_conf(
-        "cluster1", "fake_service", "instance1", "fake_deploy_group"
-    )
-    mock_inst2 = make_fake_instance_conf(
-        "cluster1", "fake_service", "instance2", "fake_deploy_group"
-    )
-    mock_inst3 = make_fake_instance_conf(
-        "cluster2", "fake_service", "instance3", "fake_deploy_group"
-    )
-    mock_get_instance_configs_for_service.return_value = [
-        mock_inst1,
-        mock_inst2,
-        mock_inst3,
-    ]
-
-    pargs = apply_args_filters(args)
-    assert sorted(pargs.keys()) == ["cluster1"]
-    assert pargs["cluster1"]["fake_service"] == {"instance1": mock_inst1.__class__}
-
-
-@patch("paasta_tools.cli.cmds.status.get_instance_configs_for_service", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_services", autospec=True)
-@patch("paasta_tools.cli.cmds.status.figure_out_service_name", autospec=True)
-@patch("paasta_tools.cli.cmds.status.validate_service_name", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_clusters", autospec=True)
-def test_apply_args_filters_clusters_uses_deploy_group_when_no_clusters_and_instances(
-    mock_list_clusters,
-    mock_validate_service_name,
-    mock_figure_out_service_name,
-    mock_list_services,
-    mock_get_instance_configs_for_service,
-):
-    args = StatusArgs(
-        service="fake_service",
-        soa_dir="/fake/soa/dir",
-        deploy_group="fake_deploy_group",
-        clusters=None,
-        instances=None,
-        owner=None,
-        registration=None,
-        verbose=False,
-        service_instance=None,
-    )
-    mock_list_clusters.return_value = ["cluster1", "cluster2"]
-    mock_validate_service_name.return_value = None
-    mock_figure_out_service_name.return_value = "fake_service"
-    mock_list_services.return_value = ["fake_service"]
-    mock_inst1 = make_fake_instance_conf(
-        "cluster1", "fake_service", "instance1", "fake_deploy_group"
-    )
-    mock_inst2 = make_fake_instance_conf(
-        "cluster1", "fake_service", "instance2", "fake_deploy_group"
-    )
-    mock_inst3 = make_fake_instance_conf(
-        "cluster2", "fake_service", "instance3", "fake_deploy_group"
-    )
-    mock_get_instance_configs_for_service.return_value = [
-        mock_inst1,
-        mock_inst2,
-        mock_inst3,
-    ]
-
-    pargs = apply_args_filters(args)
-    assert sorted(pargs.keys()) == ["cluster1", "cluster2"]
-    assert pargs["cluster1"]["fake_service"] == {
-        "instance1": mock_inst1.__class__,
-        "instance2": mock_inst2.__class__,
-    }
-    assert pargs["cluster2"]["fake_service"] == {"instance3": mock_inst3.__class__}
-
-
-@patch("paasta_tools.cli.cmds.status.get_instance_configs_for_service", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_services", autospec=True)
-@patch("paasta_tools.cli.cmds.status.figure_out_service_name", autospec=True)
-def test_apply_args_filters_clusters_return_none_when_cluster_not_in_deploy_group(
-    mock_figure_out_service_name,
-    mock_list_services,
-    mock_get_instance_configs_for_service,
-):
-    args = StatusArgs(
-        service="fake_service",
-        soa_dir="/fake/soa/dir",
-        deploy_group="fake_deploy_group",
-        clusters="cluster4",
-        instances=None,
-        owner=None,
-        registration=None,
-        verbose=False,
-        service_instance=None,
-    )
-    mock_figure_out_service_name.return_value = "fake_service"
-    mock_list_services.return_value = ["fake_service"]
-    mock_get_instance_configs_for_service.return_value = [
-        make_fake_instance_conf(
-            "cluster1", "fake_service", "instance1", "fake_deploy_group"
+@patch("paasta_tools.cli.utils.list_all_instances_for_service", autospec=True)
+@pytest.mark.parametrize(
+    "args_kwargs,instance_specs,expected",
+    [
+        # clusters, instances and deploy_group all narrow the selection
+        (
+            dict(
+                service="fake_service",
+                deploy_group="fake_deploy_group",
+                clusters="cluster1",
+                instances="instance1,instance3",
+            ),
+            [
+                ("cluster1", "instance1", "fake_deploy_group"),
+                ("cluster1", "instance2", "fake_deploy_group"),
+                ("cluster2", "instance3", "fake_deploy_group"),
+            ],
+            {"cluster1": ["instance1"]},
         ),
-        make_fake_instance_conf(
-            "cluster1", "fake_service", "instance2", "fake_deploy_group"
+        # without clusters or instances, the deploy_group picks the clusters
+        (
+            dict(service="fake_service", deploy_group="fake_deploy_group"),
+            [
+                ("cluster1", "instance1", "fake_deploy_group"),
+                ("cluster1", "instance2", "fake_deploy_group"),
+                ("cluster2", "instance3", "fake_deploy_group"),
+            ],
+            {"cluster1": ["instance1", "instance2"], "cluster2": ["instance3"]},
         ),
-        make_fake_instance_conf(
-            "cluster2", "fake_service", "instance3", "fake_deploy_group"
+        # a cluster the deploy_group does not deploy to
+        (
+            dict(
+                service="fake_service",
+                deploy_group="fake_deploy_group",
+                clusters="cluster4",
+            ),
+            [
+                ("cluster1", "instance1", "fake_deploy_group"),
+                ("cluster1", "instance2", "fake_deploy_group"),
+                ("cluster2", "instance3", "fake_deploy_group"),
+            ],
+            {},
         ),
-    ]
-
-    assert len(apply_args_filters(args)) == 0
-
-
-@patch("paasta_tools.cli.cmds.status.get_instance_configs_for_service", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_services", autospec=True)
-@patch("paasta_tools.cli.cmds.status.figure_out_service_name", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_clusters", autospec=True)
-@patch("paasta_tools.cli.utils.list_all_instances_for_service", autospec=True)
-def test_apply_args_filters_clusters_return_none_when_instance_not_in_deploy_group(
-    mock_list_clusters,
-    mock_figure_out_service_name,
-    mock_list_services,
-    mock_get_instance_configs_for_service,
-    mock_list_all_instances_for_service,
-):
-    args = StatusArgs(
-        service="fake_service",
-        soa_dir="/fake/soa/dir",
-        deploy_group="fake_deploy_group",
-        clusters=None,
-        instances="instance5",
-        owner=None,
-        registration=None,
-        verbose=False,
-        service_instance=None,
-    )
-    mock_list_clusters.return_value = ["cluster1", "cluster2"]
-    mock_figure_out_service_name.return_value = "fake_service"
-    mock_list_services.return_value = ["fake_service"]
-    mock_list_all_instances_for_service.return_value = []
-    mock_get_instance_configs_for_service.return_value = [
-        make_fake_instance_conf(
-            "cluster1", "fake_service", "instance1", "other_fake_deploy_group"
+        # an instance outside the deploy_group
+        (
+            dict(
+                service="fake_service",
+                deploy_group="fake_deploy_group",
+                instances="instance5",
+            ),
+            [
+                ("cluster1", "instance1", "other_fake_deploy_group"),
+                ("cluster1", "instance2", "other_fake_deploy_group"),
+                ("cluster2", "instance3", "other_fake_deploy_group"),
+            ],
+            {},
         ),
-        make_fake_instance_conf(
-            "cluster1", "fake_service", "instance2", "other_fake_deploy_group"
+        # clusters and instances without a deploy_group
+        (
+            dict(
+                service="fake_service",
+                clusters="cluster1",
+                instances="instance1,instance3",
+            ),
+            [
+                ("cluster1", "instance1", "fake_deploy_group"),
+                ("cluster1", "instance2", "fake_deploy_group"),
+                ("cluster1", "instance3", "fake_deploy_group"),
+            ],
+            {"cluster1": ["instance1", "instance3"]},
         ),
-        make_fake_instance_conf(
-            "cluster2", "fake_service", "instance3", "other_fake_deploy_group"
+        # service.instance shorthand notation
+        (
+            dict(clusters="cluster1", service_instance="fake_service.instance1"),
+            [
+                ("cluster1", "instance1", "fake_deploy_group"),
+                ("cluster1", "instance2", "fake_deploy_group"),
+            ],
+            {"cluster1": ["instance1"]},
+        ),
+        (
+            dict(
+                clusters="cluster1",
+                service_instance="fake_service.instance1,instance2",
+            ),
+            [
+                ("cluster1", "instance1", "fake_deploy_group"),
+                ("cluster1", "instance2", "fake_deploy_group"),
+            ],
+            {"cluster1": ["instance1", "instance2"]},
+        ),
+        (
+            dict(clusters="cluster1", service_instance="fake_service.instance3"),
+            [
+                ("cluster1", "instance1", "fake_deploy_group"),
+                ("cluster1", "instance2", "fake_deploy_group"),
+            ],
+            {},
         ),
-    ]
-
-    assert len(apply_args_filters(args)) == 0
-
-
-@patch("paasta_tools.cli.cmds.status.get_instance_configs_for_service", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_services", autospec=True)
-@patch("paasta_tools.cli.cmds.status.figure_out_service_name", autospec=True)
-@patch("paasta_tools.cli.cmds.status.validate_service_name", autospec=True)
-def test_apply_args_filters_clusters_and_instances(
-    mock_validate_service_name,
-    mock_figure_out_service_name,
-    mock_list_services,
-    mock_get_instance_configs_for_service,
-):
-    args = StatusArgs(
-        service="fake_service",
-        soa_dir="/fake/soa/dir",
-        deploy_group=None,
-        clusters="cluster1",
-        instances="instance1,instance3",
-        owner=None,
-        registration=None,
-        verbose=False,
-        service_instance=None,
-    )
-    mock_validate_service_name.return_value = None
-    mock_figure_out_service_name.return_value = "fake_service"
-    mock_list_services.return_value = ["fake_service"]
-    mock_inst1 = make_fake_instance_conf(
-        "cluster1", "fake_service", "instance1", "fake_deploy_group"
-    )
-    mock_inst2 = make_fake_instance_conf(
-        "cluster1", "fake_service", "instance2", "fake_deploy_group"
-    )
-    mock_inst3 = make_fake_instance_conf(
-        "cluster1", "fake_service", "instance3", "fake_deploy_group"
-    )
-    mock_get_instance_configs_for_service.return_value = [
-        mock_inst1,
-        mock_inst2,
-        mock_inst3,
-    ]
-
-    pargs = apply_args_filters(args)
-    assert sorted(pargs.keys()) == ["cluster1"]
-    assert pargs["cluster1"]["fake_service"] == {
-        "instance1": mock_inst1.__class__,
-        "instance3": mock_inst3.__class__,
-    }
-
-
-@patch("paasta_tools.cli.cmds.status.get_instance_configs_for_service", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_services", autospec=True)
-@patch("paasta_tools.cli.cmds.status.figure_out_service_name", autospec=True)
-@patch("paasta_tools.cli.cmds.status.validate_service_name", autospec=True)
-@pytest.mark.parametrize(
-    "service_instance_name",
-    [
-        "fake_service.instance1",
-        "fake_service.instance1,instance2",
-        "fake_service.instance3",
     ],
 )
-def test_apply_args_filters_shorthand_notation(
-    mock_validate_service_name,
-    mock_figure_out_service_name,
-    mock_list_services,
-    mock_get_instance_configs_for_service,
-    service_instance_name,
+def test_apply_args_filters(
+    mock_list_all_instances_for_service,
+    status_mocks,
+    args_kwargs,
+    instance_specs,
+    expected,
 ):
-    args = StatusArgs(
-        service=None,
-        soa_dir="/fake/soa/dir",
-        deploy_group=None,
-        clusters="cluster1",
-        instances=None,
-        owner=None,
-        registration=None,
-        verbose=False,
-        service_instance=service_instance_name,
-    )
-    mock_validate_service_name.return_value = None
-    mock_figure_out_service_name.return_value = "fake_service"
-    mock_list_services.return_value = ["fake_service"]
-    mock_inst1 = make_fake_instance_conf(
-        "cluster1", "fake_service", "instance1", "fake_deploy_group"
+    status_mocks.list_clusters.return_value = ["cluster1", "cluster2"]
+    status_mocks.figure_out_service_name.return_value = "fake_service"
+    status_mocks.list_services.return_value = ["fake_service"]
+    mock_list_all_instances_for_service.return_value = []
+    instance_confs = {
+        instance: make_fake_instance_conf(
+            cluster, "fake_service", instance, deploy_group
+        )
+        for cluster, instance, deploy_group in instance_specs
+    }
+    status_mocks.get_instance_configs_for_service.return_value = list(
+        instance_confs.values()
     )
-    mock_inst2 = make_fake_instance_conf(
-        "cluster1", "fake_service", "instance2", "fake_deploy_group"
+    args = StatusArgs(
+        **{
+            "service": None,
+            "soa_dir": "/fake/soa/dir",
+            "clusters": None,
+            "instances": None,
+            "deploy_group": None,
+            "owner": None,
+            "registration": None,
+            "verbose": False,
+            **args_kwargs,
+        }
     )
-    mock_get_instance_configs_for_service.return_value = [
-        mock_inst1,
-        mock_inst2,
-    ]
 
     pargs = apply_args_filters(args)
-    if service_instance_name == "fake_service.instance1":
-        assert sorted(pargs.keys()) == ["cluster1"]
-        assert pargs["cluster1"]["fake_service"] == {"instance1": mock_inst1.__class__}
-    elif service_instance_name == "fake_service.instance1,instance2":
-        assert sorted(pargs.keys()) == ["cluster1"]
-        assert pargs["cluster1"]["fake_service"] == {
-            "instance1": mock_inst1.__class__,
-            "instance2": mock_inst2.__class__,
+    assert pargs == {
+        cluster: {
+            "fake_service": {
+                instance: instance_confs[instance].__class__ for instance in instances
+            }
         }
-    elif service_instance_name == "fake_service.instance3":
-        assert sorted(pargs.keys()) == []
-        assert pargs["cluster1"]["fake_service"] == {}
+        for cluster, instances in expected.items()
+    }
 
 
 @patch("paasta_tools.cli.cmds.status.list_services", autospec=True)
-def test_apply_args_filters_bad_service_name(mock_list_services, capfd):
+def test_apply_args_filters_bad_service_name(mock_list_services, capsys):
     args = StatusArgs(
         service="fake-service",
         soa_dir="/fake/soa/dir",
@@ -665,7 +629,7 @@ def test_apply_args_filters_bad_service_name(mock_list_services, capfd):
     )
     mock_list_services.return_value = ["fake_service"]
     pargs = apply_args_filters(args)
-    output, _ = capfd.readouterr()
+    output, _ = capsys.readouterr()
     assert len(pargs) == 0
     assert 'The service "fake-service" does not exist.' in output
     assert "Did you mean any of these?" in output
@@ -673,17 +637,8 @@ def test_apply_args_filters_bad_service_name(mock_list_services, capfd):
 
 
 @patch("paasta_tools.cli.utils.list_all_instances_for_service", autospec=True)
-@patch("paasta_tools.cli.cmds.status.get_instance_configs_for_service", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_services", autospec=True)
-@patch("paasta_tools.cli.cmds.status.figure_out_service_name", autospec=True)
-@patch("paasta_tools.cli.cmds.status.validate_service_name", autospec=True)
 def test_apply_args_filters_no_instances_found(
-    mock_validate_service_name,
-    mock_figure_out_service_name,
-    mock_list_services,
-    mock_get_instance_configs_for_service,
-    mock_list_all_instances_for_service,
-    capfd,
+    mock_list_all_instances_for_service, status_mocks, capsys
 ):
     args = StatusArgs(
         service="fake_service",
@@ -696,10 +651,10 @@ def test_apply_args_filters_no_instances_found(
         verbose=False,
         service_instance=None,
     )
-    mock_validate_service_name.return_value = None
-    mock_figure_out_service_name.return_value = "fake_service"
-    mock_list_services.return_value = ["fake_service"]
-    mock_get_instance_configs_for_service.return_value = [
+    status_mocks.validate_service_name.return_value = None
+    status_mocks.figure_out_service_name.return_value = "fake_service"
+    status_mocks.list_services.return_value = ["fake_service"]
+    status_mocks.get_instance_configs_for_service.return_value = [
         make_fake_instance_conf(
             "cluster1", "fake_service", "instance1", "fake_deploy_group"
         ),
@@ -716,7 +671,7 @@ def test_apply_args_filters_no_instances_found(
         "instance3",
     ]
     pargs = apply_args_filters(args)
-    output, _ = capfd.readouterr()
+    output, _ = capsys.readouterr()
     assert len(pargs.keys()) == 0
     assert (
         "fake_service doesn't have any instances matching instance4, instance5 on cluster1."
@@ -728,120 +683,77 @@ def test_apply_args_filters_no_instances_found(
         assert i in output
 
 
-@patch("paasta_tools.cli.cmds.status.get_instance_configs_for_service", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_services", autospec=True)
-@patch("paasta_tools.cli.cmds.status.figure_out_service_name", autospec=True)
-@patch("paasta_tools.cli.cmds.status.get_actual_deployments", autospec=True)
-@patch("paasta_tools.cli.cmds.status.load_system_paasta_config", autospec=True)
-@patch("paasta_tools.cli.cmds.status.report_status_for_cluster", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_clusters", autospec=True)
-@patch("paasta_tools.cli.cmds.status.get_planned_deployments", autospec=True)
-def test_status_with_owner(
-    mock_get_planned_deployments,
-    mock_list_clusters,
-    mock_report_status,
-    mock_load_system_paasta_config,
-    mock_get_actual_deployments,
-    mock_figure_out_service_name,
-    mock_list_services,
-    mock_get_instance_configs_for_service,
-    system_paasta_config,
-):
-
-    mock_load_system_paasta_config.return_value = system_paasta_config
-    mock_list_services.return_value = ["fakeservice", "otherservice"]
+def test_status_with_owner(status_mocks):
+    status_mocks.list_services.return_value = ["fakeservice", "otherservice"]
     cluster = "fake_cluster"
-    mock_list_clusters.return_value = [cluster]
+    status_mocks.list_clusters.return_value = [cluster]
     mock_inst_1 = make_fake_instance_conf(
         cluster, "fakeservice", "instance1", team="faketeam"
     )
     mock_inst_2 = make_fake_instance_conf(
         cluster, "otherservice", "instance3", team="faketeam"
     )
-    mock_get_instance_configs_for_service.return_value = [mock_inst_1, mock_inst_2]
-    mock_get_planned_deployments.return_value = [
+    status_mocks.get_instance_configs_for_service.return_value = [
+        mock_inst_1,
+        mock_inst_2,
+    ]
+    status_mocks.get_planned_deployments.return_value = [
         "fakeservice.instance1",
         "otherservice.instance3",
     ]
 
-    mock_get_actual_deployments.return_value = {
+    status_mocks.get_actual_deployments.return_value = {
         "fakeservice.instance1": "sha1",
         "fakeservice.instance2": "sha2",
         "otherservice.instance3": "sha3",
         "otherservice.instance1": "sha4",
     }
-    mock_report_status.return_value = 0, ["dummy", "output"]
-
-    args = MagicMock()
-    args.service = None
-    args.instances = None
-    args.clusters = None
-    args.deploy_group = None
-    args.owner = "faketeam"
-    args.soa_dir = "/fake/soa/dir"
-    args.registration = None
-    args.service_instance = None
+    status_mocks.report_status_for_cluster.return_value = 0, ["dummy", "output"]
+
+    args = StatusArgs(
+        service=None,
+        soa_dir="/fake/soa/dir",
+        clusters=None,
+        instances=None,
+        deploy_group=None,
+        owner="faketeam",
+        registration=None,
+        verbose=False,
+    )
     return_value = paasta_status(args)
 
     assert return_value == 0
-    assert mock_report_status.call_count == 2
+    assert status_mocks.report_status_for_cluster.call_count == 2
 
 
-@patch("paasta_tools.cli.cmds.status.list_clusters", autospec=True)
-@patch("paasta_tools.cli.cmds.status.get_instance_configs_for_service", autospec=True)
-@patch("paasta_tools.cli.cmds.status.list_services", autospec=True)
-@patch("paasta_tools.cli.cmds.status.figure_out_service_name", autospec=True)
-@patch("paasta_tools.cli.cmds.status.get_actual_deployments", autospec=True)
-@patch("paasta_tools.cli.cmds.status.load_system_paasta_config", autospec=True)
-@patch("paasta_tools.cli.cmds.status.report_status_for_cluster", autospec=True)
-@patch("paasta_tools.cli.cmds.status.get_planned_deployments", autospec=True)
-@patch("paasta_tools.cli.cmds.status.validate_service_name", autospec=True)
-def test_status_with_registration(
-    mock_validate_service_name,
-    mock_get_planned_deployments,
-    mock_report_status,
-    mock_load_system_paasta_config,
-    mock_get_actual_deployments,
-    mock_figure_out_service_name,
-    mock_list_services,
-    mock_get_instance_configs_for_service,
-    mock_list_clusters,
-    system_paasta_config,
-):
-    mock_validate_service_name.return_value = None
-    mock_load_system_paasta_config.return_value = system_paasta_config
-    mock_list_services.return_value = ["fakeservice", "otherservice"]
+def test_status_with_registration(status_mocks, system_paasta_config):
+    status_mocks.validate_service_name.return_value = None
+    status_mocks.list_services.return_value = ["fakeservice", "otherservice"]
     cluster = "fake_cluster"
-    mock_list_clusters.return_value = [cluster]
-    mock_get_planned_deployments.return_value = [
+    status_mocks.list_clusters.return_value = [cluster]
+    status_mocks.get_planned_deployments.return_value = [
         "fakeservice.main",
         "fakeservice.not_main",
     ]
-    mock_inst_1 = make_fake_instance_conf(
-        cluster, "fakeservice", "instance1", registrations=["fakeservice.main"]
-    )
-    mock_inst_2 = make_fake_instance_conf(
-        cluster, "fakeservice", "instance2", registrations=["fakeservice.not_main"]
-    )
-    mock_inst_3 = make_fake_instance_conf(
-        cluster, "fakeservice", "instance3", registrations=["fakeservice.also_not_main"]
-    )
-    mock_inst_4 = make_fake_instance_conf(
-        cluster, "fakeservice", "instance4", registrations=None
-    )
-    mock_get_instance_configs_for_service.return_value = [
-        mock_inst_1,
-        mock_inst_2,
-        mock_inst_3,
-        mock_inst_4,
+    mock_insts = [
+        make_fake_instance_conf(
+            cluster, "fakeservice", instance, registrations=registrations
+        )
+        for instance, registrations in [
+            ("instance1", ["fakeservice.main"]),
+            ("instance2", ["fakeservice.not_main"]),
+            ("instance3", ["fakeservice.also_not_main"]),
+            ("instance4", None),
+        ]
     ]
+    status_mocks.get_instance_configs_for_service.return_value = mock_insts
 
-    mock_get_actual_deployments.return_value = {
+    status_mocks.get_actual_deployments.return_value = {
         "fakeservice.instance1": "sha1",
         "fakeservice.instance2": "sha2",
         "fakeservice.instance3": "sha3",
     }
-    mock_report_status.return_value = 0, ["dummy", "output"]
+    status_mocks.report_status_for_cluster.return_value = 0, ["dummy", "output"]
 
     args = StatusArgs(
         service="fakeservice",
@@ -858,24 +770,25 @@ def test_status_with_registration(
     return_value = paasta_status(args)
 
     assert return_value == 0
-    assert mock_report_status.call_count == 1
-    mock_report_status.assert_called_once_with(
+    assert status_mocks.report_status_for_cluster.call_count == 1
+    status_mocks.report_status_for_cluster.assert_called_once_with(
         service="fakeservice",
         cluster=cluster,
         deploy_pipeline=ANY,
         actual_deployments=ANY,
         instance_whitelist={
-            "instance1": mock_inst_1.__class__,
-            "instance2": mock_inst_2.__class__,
+            "instance1": mock_insts[0].__class__,
+            "instance2": mock_insts[1].__class__,
         },
         system_paasta_config=system_paasta_config,
         verbose=args.verbose,
         new=False,
+        get_client=ANY,
+        executor=ANY,
     )
 
 
-@pytest.fixture
-def mock_marathon_status(include_envoy=True, include_smartstack=True):
+def make_marathon_status(include_envoy=True, include_smartstack=True):
     kwargs = dict(
         desired_state="start",
         desired_app_id="abc.def",
@@ -905,6 +818,11 @@ def mock_marathon_status(include_envoy=True, include_smartstack=True):
     return paastamodels.InstanceStatusMarathon(**kwargs)
 
 
+@pytest.fixture
+def mock_marathon_status():
+    return make_marathon_status()
+
+
 @pytest.fixture
 def mock_kubernetes_status():
     return paastamodels.InstanceStatusKubernetes(
@@ -936,7 +854,7 @@ def mock_kubernetes_status():
 
 @pytest.fixture
 def mock_kafka_status() -> Mapping[str, Any]:
-    return defaultdict(
+    return dict(
         metadata=dict(
             name="kafka--k8s-local-main",
             namespace="paasta-kafkaclusters",
@@ -1004,6 +922,32 @@ def test_paasta_status_on_api_endpoint_marathon(
     )
 
 
+@mock.patch("paasta_tools.cli.cmds.status.get_paasta_oapi_client", autospec=True)
+def test_paasta_status_on_api_endpoint_uses_given_client(
+    mock_get_paasta_oapi_client, system_paasta_config, mock_marathon_status
+):
+    mock_client = Mock()
+    mock_client.service.status_instance.return_value = paastamodels.InstanceStatus(
+        git_sha="fake_git_sha",
+        instance="fake_instance",
+        service="fake_service",
+        marathon=mock_marathon_status,
+    )
+
+    paasta_status_on_api_endpoint(
+        cluster="fake_cluster",
+        service="fake_service",
+        instance="fake_instance",
+        output=[],
+        system_paasta_config=system_paasta_config,
+        verbose=0,
+        client=mock_client,
+    )
+
+    assert mock_client.service.status_instance.call_count == 1
+    assert mock_get_paasta_oapi_client.call_count == 0
+
+
 def test_paasta_status_exception(system_paasta_config):
     with patch(
         "paasta_tools.cli.cmds.status.get_paasta_oapi_client", autospec=True
@@ -1025,11 +969,12 @@ def test_paasta_status_exception(system_paasta_config):
 
 
 def test_format_kubernetes_replicaset_table_in_non_verbose(mock_kubernetes_status):
-    with mock.patch(
-        "paasta_tools.cli.cmds.status.format_kubernetes_replicaset_table", autospec=True
-    ) as mock_format_kubernetes_replicaset_table, mock.patch(
-        "paasta_tools.cli.cmds.status.bouncing_status_human", autospec=True
-    ):
+    with patch.multiple(
+        "paasta_tools.cli.cmds.status",
+        autospec=True,
+        format_kubernetes_replicaset_table=mock.DEFAULT,
+        bouncing_status_human=mock.DEFAULT,
+    ) as mocks:
         mock_kubernetes_status.replicasets = [
             paastamodels.KubernetesReplicaSet(
                 name="replicaset_1",
@@ -1050,7 +995,7 @@ def test_format_kubernetes_replicaset_table_in_non_verbose(mock_kubernetes_statu
             verbose=0,
         )
 
-        assert mock_format_kubernetes_replicaset_table.called
+        assert mocks["format_kubernetes_replicaset_table"].called
 
 
 class TestPrintMarathonStatus:
@@ -1124,7 +1069,7 @@ class TestPrintMarathonStatus:
             "autoscaling info 2",
         ]
 
-        mms = mock_marathon_status(
+        mms = make_marathon_status(
             include_smartstack=include_smartstack, include_envoy=include_envoy
         )
         mms.app_statuses = [
@@ -1243,10 +1188,12 @@ class TestPrintKubernetesStatusV2:
             status=mock_kubernetes_status_v2,
             verbose=0,
         )
-        joined_output = "\n".join(output)
-        assert f"State: {mock_get_instance_state.return_value}" in joined_output
-        for table_entry in mock_versions_table:
-            assert table_entry in joined_output
+        assert any(
+            f"State: {mock_get_instance_state.return_value}" in line for line in output
+        )
+        assert output[-len(mock_versions_table) :] == [
+            f"      {table_entry}" for table_entry in mock_versions_table
+        ]
 
 
 class TestGetInstanceState:
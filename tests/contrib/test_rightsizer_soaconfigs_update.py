@@ -0,0 +1,49 @@
+import pytest
+
+from paasta_tools.contrib.rightsizer_soaconfigs_update import (
+    get_recommendation_from_result,
+)
+from paasta_tools.contrib.rightsizer_soaconfigs_update import SUPPORTED_CSV_KEYS
+
+
+@pytest.mark.parametrize(
+    "result,keys_to_apply,expected",
+    [
+        (
+            {
+                "cpus": "0.5",
+                "mem": "100.4",
+                "disk": "1024.6",
+                "cpu_burst_add": "2",
+                "min_instances": "3",
+                "max_instances": "10",
+            },
+            SUPPORTED_CSV_KEYS,
+            {
+                "cpus": 0.5,
+                "mem": 128,
+                "disk": 1025,
+                "cpu_burst_add": 1,
+                "min_instances": 3,
+                "max_instances": 10,
+            },
+        ),
+        (
+            {"hacheck_cpus": "0.01"},
+            SUPPORTED_CSV_KEYS,
+            {
+                "sidecar_resource_requirements": {
+                    "hacheck": {"requests": {"cpu": 0.1}, "limits": {"cpu": 0.1}}
+                }
+            },
+        ),
+        # only the requested keys are applied
+        ({"cpus": "0.5", "mem": "512"}, ["mem"], {"mem": 512}),
+        # empty and null values are skipped
+        ({"cpus": "", "mem": "null"}, SUPPORTED_CSV_KEYS, {}),
+        # unsupported keys are skipped rather than raising
+        ({"cpus": "0.5", "gpus": "1"}, ["cpus", "gpus"], {"cpus": 0.5}),
+    ],
+)
+def test_get_recommendation_from_result(result, keys_to_apply, expected):
+    assert get_recommendation_from_result(result, keys_to_apply) == expected
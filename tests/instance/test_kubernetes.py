@@ -11,10 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import datetime
 
+import asynctest
 import mock
 import pytest
+from kubernetes.client import V1ContainerState
+from kubernetes.client import V1ContainerStateRunning
+from kubernetes.client import V1ContainerStateTerminated
+from kubernetes.client import V1ContainerStateWaiting
+from kubernetes.client import V1ReplicaSet
+from kubernetes.client import V1ReplicaSetStatus
 
 import paasta_tools.instance.kubernetes as pik
 from paasta_tools import utils
@@ -117,7 +125,16 @@ def test_kubernetes_status(
     assert "desired_state" in status
 
 
-@mock.patch("paasta_tools.instance.kubernetes.mesh_status", autospec=True)
+@pytest.fixture
+def mock_mesh_status():
+    # mesh_status is a coroutine function, which only asynctest knows how to
+    # autospec; its decorator form can't be mixed with mock.patch decorators
+    with asynctest.patch(
+        "paasta_tools.instance.kubernetes.mesh_status", autospec=True
+    ) as fixture:
+        yield fixture
+
+
 @mock.patch("paasta_tools.kubernetes_tools.pods_for_service_instance", autospec=True)
 @mock.patch(
     "paasta_tools.kubernetes_tools.load_service_namespace_config", autospec=True
@@ -332,8 +349,39 @@ class TestKubernetesStatusV2:
         }
 
 
-@mock.patch("paasta_tools.kubernetes_tools.get_kubernetes_app_by_name", autospec=True)
-def test_job_status_include_replicaset_non_verbose(mock_get_kubernetes_app_by_name):
+@pytest.mark.asyncio
+async def test_pod_info_keeps_container_order():
+    async def fake_tail_lines(client, pod, container, num_tail_lines):
+        return f"{container.name} tail lines"
+
+    container_1 = mock.Mock()
+    container_1.name = "container_1"
+    container_2 = mock.Mock()
+    container_2.name = "container_2"
+    mock_pod = mock.MagicMock()
+    mock_pod.status.container_statuses = [container_1, container_2]
+
+    with mock.patch(
+        "paasta_tools.instance.kubernetes.get_pod_event_messages",
+        autospec=True,
+        return_value=asyncio.sleep(0, result=["event"]),
+    ), mock.patch(
+        "paasta_tools.instance.kubernetes.get_tail_lines_for_kubernetes_container",
+        autospec=True,
+        side_effect=fake_tail_lines,
+    ), mock.patch(
+        "paasta_tools.kubernetes_tools.get_pod_hostname", autospec=True
+    ):
+        info = await pik.pod_info(mock_pod, mock.Mock(), 10)
+
+    assert info["events"] == ["event"]
+    assert info["containers"] == [
+        dict(name="container_1", tail_lines="container_1 tail lines"),
+        dict(name="container_2", tail_lines="container_2 tail lines"),
+    ]
+
+
+def test_job_status_include_replicaset_non_verbose():
     kstatus = {}
     pik.job_status(
         kstatus=kstatus,
@@ -343,16 +391,47 @@ def test_job_status_include_replicaset_non_verbose(mock_get_kubernetes_app_by_na
         replicaset_list=[mock.Mock(), mock.Mock(), mock.Mock()],
         verbose=0,
         namespace=mock.Mock(),
+        app=mock.Mock(),
     )
 
     assert len(kstatus["replicasets"]) == 3
 
 
+@mock.patch("paasta_tools.instance.kubernetes.POD_INFO_CONCURRENCY", 2, autospec=None)
+@mock.patch("paasta_tools.instance.kubernetes.pod_info", autospec=True)
+def test_job_status_bounds_pod_info_concurrency(mock_pod_info):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_pod_info(pod, client, num_tail_lines):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return pod
+
+    mock_pod_info.side_effect = fake_pod_info
+    kstatus = {}
+    pik.job_status(
+        kstatus=kstatus,
+        client=mock.Mock(),
+        job_config=mock.Mock(),
+        pod_list=["pod_1", "pod_2", "pod_3", "pod_4", "pod_5"],
+        replicaset_list=[],
+        verbose=1,
+        namespace=mock.Mock(),
+        app=mock.Mock(),
+    )
+
+    assert kstatus["pods"] == ["pod_1", "pod_2", "pod_3", "pod_4", "pod_5"]
+    assert max_in_flight == 2
+
+
 @mock.patch("paasta_tools.instance.kubernetes.job_status", autospec=True)
 @mock.patch(
     "paasta_tools.kubernetes_tools.load_service_namespace_config", autospec=True
 )
-@mock.patch("paasta_tools.instance.kubernetes.mesh_status", autospec=True)
 @mock.patch(
     "paasta_tools.kubernetes_tools.replicasets_for_service_instance", autospec=True
 )
@@ -367,9 +446,9 @@ def test_kubernetes_status_include_smartstack(
     mock_get_kubernetes_app_by_name,
     mock_pods_for_service_instance,
     mock_replicasets_for_service_instance,
-    mock_mesh_status,
     mock_load_service_namespace_config,
     mock_job_status,
+    mock_mesh_status,
 ):
     mock_load_service_namespace_config.return_value = {"proxy_port": 1234}
     mock_LONG_RUNNING_INSTANCE_TYPE_HANDLERS["flink"] = mock.Mock()
@@ -461,6 +540,25 @@ def test_can_handle():
     assert not pik.can_handle("marathon")
 
 
+def test_get_pods_by_replicaset():
+    rs_pod = Struct(
+        metadata=Struct(
+            owner_references=[
+                Struct(kind="Node", name="node_1"),
+                Struct(kind="ReplicaSet", name="replicaset_1"),
+            ]
+        )
+    )
+    sts_pod = Struct(
+        metadata=Struct(owner_references=[Struct(kind="StatefulSet", name="sts_1")])
+    )
+    orphan_pod = Struct(metadata=Struct(owner_references=None))
+
+    assert pik.get_pods_by_replicaset([rs_pod, sts_pod, orphan_pod]) == {
+        "replicaset_1": [rs_pod]
+    }
+
+
 def test_filter_actually_running_replicasets():
     replicaset_list = [
         mock.Mock(),
@@ -490,6 +588,19 @@ def test_filter_actually_running_replicasets():
     assert pik.filter_actually_running_replicasets(replicaset_list) == expected
 
 
+@pytest.mark.parametrize(
+    "status,expected",
+    [
+        (None, 0),
+        (V1ReplicaSetStatus(replicas=2, ready_replicas=None), 0),
+        (V1ReplicaSetStatus(replicas=2, ready_replicas=2), 2),
+    ],
+)
+def test_ready_replicas_from_replicaset(status, expected):
+    replicaset = V1ReplicaSet(status=status)
+    assert pik.ready_replicas_from_replicaset(replicaset) == expected
+
+
 @mock.patch("paasta_tools.instance.kubernetes.get_pod_containers", autospec=True)
 @mock.patch("paasta_tools.kubernetes_tools.is_pod_scheduled", autospec=True)
 def test_get_pod_status_ready_with_backends(
@@ -508,10 +619,54 @@ def test_get_pod_status_ready_with_backends(
     assert not status["ready"]
 
 
+def test_get_pod_containers_matches_specs_by_name():
+    mock_pod = mock.MagicMock()
+    spec_a = mock.Mock(liveness_probe=mock.Mock(initial_delay_seconds=60))
+    spec_a.name = "a"
+    spec_b = mock.Mock(liveness_probe=None)
+    spec_b.name = "b"
+    mock_pod.spec.containers = [spec_b, spec_a]
+    status_a = mock.Mock(restart_count=0)
+    status_a.name = "a"
+    status_a.state = V1ContainerState(
+        running=V1ContainerStateRunning(started_at=datetime.datetime(2020, 1, 1))
+    )
+    status_a.last_state = V1ContainerState(
+        terminated=V1ContainerStateTerminated(
+            exit_code=1,
+            reason="Error",
+            message="oops",
+            started_at=datetime.datetime(2019, 12, 31, 23, 59, 0),
+            finished_at=datetime.datetime(2019, 12, 31, 23, 59, 30),
+        )
+    )
+    status_b = mock.Mock(restart_count=0)
+    status_b.name = "b"
+    status_b.state = V1ContainerState(
+        waiting=V1ContainerStateWaiting(reason="CrashLoopBackOff", message="boom")
+    )
+    status_b.last_state = V1ContainerState()
+    mock_pod.status.container_statuses = [status_a, status_b]
+
+    containers = pik.get_pod_containers(mock_pod)
+    assert [c["name"] for c in containers] == ["a", "b"]
+    assert [c["healthcheck_grace_period"] for c in containers] == [60, None]
+    assert containers[0]["state"] == "running"
+    assert containers[0]["timestamp"] == datetime.datetime(2020, 1, 1).timestamp()
+    assert containers[0]["last_state"] == "terminated"
+    assert containers[0]["last_reason"] == "Error"
+    assert containers[0]["last_message"] == "oops"
+    assert containers[0]["last_duration"] == 30
+    assert containers[1]["state"] == "waiting"
+    assert containers[1]["reason"] == "CrashLoopBackOff"
+    assert containers[1]["message"] == "boom"
+    assert containers[1]["last_state"] is None
+
+
 @mock.patch(
     "paasta_tools.kubernetes_tools.load_service_namespace_config", autospec=True
 )
-@mock.patch("paasta_tools.instance.kubernetes.mesh_status", autospec=True)
+@mock.patch("paasta_tools.kubernetes_tools.get_all_nodes", autospec=True)
 @mock.patch("paasta_tools.kubernetes_tools.pods_for_service_instance", autospec=True)
 @mock.patch(
     "paasta_tools.instance.kubernetes.LONG_RUNNING_INSTANCE_TYPE_HANDLERS",
@@ -528,8 +683,9 @@ def test_get_pod_status_ready_with_backends(
 )
 def test_kubernetes_mesh_status(
     mock_pods_for_service_instance,
-    mock_mesh_status,
+    mock_get_all_nodes,
     mock_load_service_namespace_config,
+    mock_mesh_status,
     include_smartstack,
     include_envoy,
     expected,
@@ -551,53 +707,72 @@ def test_kubernetes_mesh_status(
     )
 
     assert len(kmesh) == len(expected)
-    for i in range(len(expected)):
-        mesh_type = expected[i]
+    for mesh_type in expected:
         assert kmesh.get(mesh_type) == mock_mesh_status.return_value
-        assert mock_mesh_status.call_args_list[i] == mock.call(
-            service="fake_service",
-            instance=mock_job_config.get_nerve_namespace.return_value,
-            job_config=mock_job_config,
-            service_namespace_config={"proxy_port": 1234},
-            pods=["pod_1"],
-            should_return_individual_backends=True,
-            settings=mock_settings,
-            service_mesh=getattr(pik.ServiceMesh, mesh_type.upper()),
-        )
+    # The meshes are queried concurrently, so the calls may land in any order
+    mock_mesh_status.assert_has_calls(
+        [
+            mock.call(
+                service="fake_service",
+                instance=mock_job_config.get_nerve_namespace.return_value,
+                job_config=mock_job_config,
+                service_namespace_config={"proxy_port": 1234},
+                pods=["pod_1"],
+                should_return_individual_backends=True,
+                settings=mock_settings,
+                nodes=mock_get_all_nodes.return_value,
+                service_mesh=getattr(pik.ServiceMesh, mesh_type.upper()),
+            )
+            for mesh_type in expected
+        ],
+        any_order=True,
+    )
+    assert mock_mesh_status.call_count == len(expected)
+    mock_get_all_nodes.assert_called_once_with(mock_settings.kubernetes_client)
+    mock_pods_for_service_instance.assert_called_once_with(
+        mock_job_config.service,
+        mock_job_config.instance,
+        mock_settings.kubernetes_client,
+        mock_job_config.get_kubernetes_namespace.return_value,
+        resource_version="0",
+        field_selector="status.phase=Running",
+    )
 
 
 @mock.patch(
     "paasta_tools.kubernetes_tools.load_service_namespace_config", autospec=True
 )
-@mock.patch("paasta_tools.instance.kubernetes.mesh_status", autospec=True)
-@mock.patch(
-    "paasta_tools.kubernetes_tools.pods_for_service_instance",
-    mock.Mock(return_value=("pod_1")),
-    autospec=False,
-)
+@mock.patch("paasta_tools.kubernetes_tools.get_all_nodes", autospec=True)
+@mock.patch("paasta_tools.kubernetes_tools.pods_for_service_instance", autospec=True)
 @mock.patch(
     "paasta_tools.instance.kubernetes.LONG_RUNNING_INSTANCE_TYPE_HANDLERS",
     {"flink": mock.Mock()},
     autospec=False,
 )
 @pytest.mark.parametrize(
-    "include_mesh,inst_type,service_ns_conf,expected_msg",
+    "include_mesh,inst_type,service_ns_conf,expected_msg,loads_config",
     [
-        (False, "flink", {"proxy_port": 1234}, "No mesh types"),
-        (True, "tron", {"proxy_port": 1234}, "not supported"),
-        (True, "flink", {}, "not configured"),
+        (False, "flink", {"proxy_port": 1234}, "No mesh types", False),
+        (True, "tron", {"proxy_port": 1234}, "not supported", False),
+        (True, "flink", {}, "not configured", True),
     ],
 )
 def test_kubernetes_mesh_status_error(
-    mock_mesh_status,
+    mock_pods_for_service_instance,
+    mock_get_all_nodes,
     mock_load_service_namespace_config,
+    mock_mesh_status,
     include_mesh,
     inst_type,
     service_ns_conf,
     expected_msg,
+    loads_config,
 ):
     mock_load_service_namespace_config.return_value = service_ns_conf
     mock_settings = mock.Mock()
+    # The patched handlers dict is shared by every parametrized case
+    mock_loader = pik.LONG_RUNNING_INSTANCE_TYPE_HANDLERS["flink"].loader
+    mock_loader.reset_mock()
 
     with pytest.raises(RuntimeError) as excinfo:
         pik.kubernetes_mesh_status(
@@ -611,3 +786,9 @@ def test_kubernetes_mesh_status_error(
 
     assert expected_msg in excinfo.value.args[0]
     assert mock_mesh_status.call_args_list == []
+    # Requests that cannot be served must fail before listing anything from
+    # kubernetes, and argument errors before loading any config at all
+    assert mock_pods_for_service_instance.call_args_list == []
+    assert mock_get_all_nodes.call_args_list == []
+    assert mock_loader.called == loads_config
+    assert mock_load_service_namespace_config.called == loads_config
@@ -105,11 +105,13 @@ from paasta_tools.kubernetes_tools import list_all_deployments
 from paasta_tools.kubernetes_tools import list_custom_resources
 from paasta_tools.kubernetes_tools import load_kubernetes_service_config
 from paasta_tools.kubernetes_tools import load_kubernetes_service_config_no_cache
+from paasta_tools.kubernetes_tools import load_service_namespace_config_cached
 from paasta_tools.kubernetes_tools import max_unavailable
 from paasta_tools.kubernetes_tools import mode_to_int
 from paasta_tools.kubernetes_tools import paasta_prefixed
 from paasta_tools.kubernetes_tools import pod_disruption_budget_for_service_instance
 from paasta_tools.kubernetes_tools import pods_for_service_instance
+from paasta_tools.kubernetes_tools import pods_for_service_instance_cached
 from paasta_tools.kubernetes_tools import sanitise_kubernetes_name
 from paasta_tools.kubernetes_tools import set_instances_for_kubernetes_service
 from paasta_tools.kubernetes_tools import update_custom_resource
@@ -2344,6 +2346,9 @@ def test_KubeClient():
         client = KubeClient()
         assert client.deployments == mock_kube_client.AppsV1Api()
         assert client.core == mock_kube_client.CoreV1Api()
+        assert client.api_client == mock_kube_client.ApiClient.return_value
+        mock_kube_client.CoreV1Api.assert_any_call(client.api_client)
+        mock_kube_client.AppsV1Api.assert_any_call(client.api_client)
 
 
 def test_ensure_namespace():
@@ -2882,6 +2887,64 @@ def test_pods_for_service_instance():
     )
 
 
+def test_pods_for_service_instance_field_selector():
+    mock_client = mock.Mock()
+    pods_for_service_instance(
+        "kurupt", "fm", mock_client, field_selector="status.phase=Running"
+    )
+    mock_client.core.list_namespaced_pod.assert_called_once_with(
+        label_selector="paasta.yelp.com/service=kurupt,paasta.yelp.com/instance=fm",
+        namespace="paasta",
+        resource_version=None,
+        field_selector="status.phase=Running",
+    )
+
+
+@pytest.fixture
+def clear_kubernetes_tools_caches():
+    cached_functions = [
+        getattr(kubernetes_tools, name)
+        for name in dir(kubernetes_tools)
+        if name.endswith("_cached")
+    ]
+    for cached_function in cached_functions:
+        cached_function.cache_clear()
+    yield
+    for cached_function in cached_functions:
+        cached_function.cache_clear()
+
+
+def test_pods_for_service_instance_cached(clear_kubernetes_tools_caches):
+    mock_client = mock.Mock()
+    assert (
+        pods_for_service_instance_cached("kurupt", "fm", mock_client)
+        == mock_client.core.list_namespaced_pod.return_value.items
+    )
+    pods_for_service_instance_cached("kurupt", "fm", mock_client)
+    mock_client.core.list_namespaced_pod.assert_called_once_with(
+        label_selector="paasta.yelp.com/service=kurupt,paasta.yelp.com/instance=fm",
+        namespace="paasta",
+        resource_version="0",
+        field_selector=None,
+    )
+
+
+def test_load_service_namespace_config_cached(clear_kubernetes_tools_caches):
+    with mock.patch(
+        "paasta_tools.kubernetes_tools.load_service_namespace_config", autospec=True
+    ) as mock_load_service_namespace_config:
+        for _ in range(2):
+            assert (
+                load_service_namespace_config_cached(
+                    service="kurupt", namespace="fm", soa_dir="/nail/blah"
+                )
+                == mock_load_service_namespace_config.return_value
+            )
+        mock_load_service_namespace_config.assert_called_once_with(
+            service="kurupt", namespace="fm", soa_dir="/nail/blah"
+        )
+
+
 def test_get_active_shas_for_service():
     mock_pod_list = [
         mock.Mock(
@@ -2615,3 +2615,42 @@ def test_filter_templates_from_config():
         "instance0": "bar",
         "instance1": "baz",
     }
+
+
+def test_time_cache_reuses_fresh_entries_and_evicts_expired_ones():
+    calls = []
+
+    with mock.patch("paasta_tools.utils.time.time", autospec=True) as mock_time:
+        mock_time.return_value = 100
+        cache = utils.time_cache(ttl=5)
+
+        @cache
+        def double(x):
+            calls.append(x)
+            return x * 2
+
+        assert double(1) == 2
+        mock_time.return_value = 104
+        assert double(1) == 2
+        assert calls == [1]
+
+        mock_time.return_value = 110
+        assert double(2) == 4
+
+    assert calls == [1, 2]
+    # the entry for 1 expired and was dropped when 2 was cached
+    assert list(cache.configs) == [(2,)]
+
+
+def test_time_cache_cache_clear():
+    calls = []
+
+    @utils.time_cache(ttl=300)
+    def double(x):
+        calls.append(x)
+        return x * 2
+
+    assert double(1) == 2
+    double.cache_clear()
+    assert double(1) == 2
+    assert calls == [1, 1]